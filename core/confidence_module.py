@@ -1,11 +1,93 @@
 # core/confidence_module.py
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; sem ele a contagem usa apenas str.split
+    np = None
+
+# Abaixo deste tamanho, str.split() é mais rápido que as verificações do caminho por contagem de espaços
+_COUNT_MIN_LENGTH = 256
+
+# A varredura vetorizada só compensa o custo de criar o array em textos longos
+_VECTOR_MIN_LENGTH = 4096
+
+if np is not None:
+    # Tabela de consulta com os bytes ASCII que str.split() trata como espaço em branco
+    _ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+    _ASCII_WHITESPACE[[0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20]] = True
+
+# Obtido uma única vez por módulo; o nome da classe é mantido como nome do logger
+_LOG = logging.getLogger('ConfidenceModule')
+
+def _count_words(text: str) -> int:
+    """
+    Conta as palavras de um texto com a mesma semântica de len(text.split()).
+
+    Em textos ASCII longos, conta as transições espaço -> não-espaço numa única
+    passada vetorizada sobre os bytes, sem materializar a lista de substrings.
+    Em textos ASCII médios separados por espaços simples, conta os espaços com str.count.
+
+    Parâmetros:
+    - text (str): Texto a ser contado.
+
+    Retorna:
+    - int: Número de palavras.
+    """
+    length = len(text)
+    if length < _COUNT_MIN_LENGTH or not text.isascii():
+        return len(text.split())
+    if np is None or length < _VECTOR_MIN_LENGTH:
+        # Em ASCII, isprintable() descarta tabulações, quebras de linha e os demais separadores de controle;
+        # sem espaços duplos, cada espaço separa duas palavras, exceto nas bordas
+        if text.isprintable() and '  ' not in text:
+            return text.count(' ') + 1 - (text[0] == ' ') - (text[-1] == ' ')
+        return len(text.split())
+    is_space = _ASCII_WHITESPACE[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    word_starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+    return int(word_starts) + (0 if is_space[0] else 1)
+
+def _score(
+    total_word_count: int,
+    both_present: bool,
+    high_multiplier: float,
+    partial_multiplier: float,
+    max_confidence: float
+) -> float:
+    """
+    Núcleo aritmético da confiança a partir das contagens de palavras.
+
+    Quando apenas um dos textos está presente, o outro é vazio e contribui com zero
+    palavras, então a soma das contagens equivale à contagem do texto presente.
+
+    Parâmetros:
+    - total_word_count (int): Soma das palavras da definição e do exemplo.
+    - both_present (bool): True se definição e exemplo estão ambos presentes.
+    - high_multiplier (float): Multiplicador para definição e exemplo presentes.
+    - partial_multiplier (float): Multiplicador para apenas definição ou exemplo presente.
+    - max_confidence (float): Valor máximo de confiança.
+
+    Retorna:
+    - float: Valor de confiança, limitado por max_confidence.
+    """
+    multiplier = high_multiplier if both_present else partial_multiplier
+    return min(max_confidence, total_word_count * multiplier)
+
+def _as_text(value: Any) -> str:
+    """Converte uma entrada qualquer em texto, tratando None como vazio."""
+    if type(value) is str or isinstance(value, str):
+        return value
+    return "" if value is None else str(value)
 
 class ConfidenceModule:
     """Módulo para calcular a confiança das respostas."""
 
+    # Entradas curtas são mais baratas de recalcular do que de manter em cache
+    CACHE_MIN_LENGTH = 64
+
     def __init__(self, high_multiplier: float = 2.0, partial_multiplier: float = 1.5, max_confidence: float = 100.0):
         """
         Inicializa o ConfidenceModule com multiplicadores configuráveis.
@@ -15,11 +97,37 @@ class ConfidenceModule:
         - partial_multiplier (float): Multiplicador para apenas definição ou exemplo presente.
         - max_confidence (float): Valor máximo de confiança.
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger = _LOG
         self.high_multiplier = high_multiplier
         self.partial_multiplier = partial_multiplier
         self.max_confidence = max_confidence
 
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _compute(
+        definition: str,
+        example: str,
+        high_multiplier: float,
+        partial_multiplier: float,
+        max_confidence: float
+    ) -> Tuple[float, int, int]:
+        """
+        Núcleo puro do cálculo de confiança, memoizado por (definição, exemplo, multiplicadores).
+
+        Retorna:
+        - tuple: (confiança, palavras da definição, palavras do exemplo).
+        """
+        definition_word_count = _count_words(definition)
+        example_word_count = _count_words(example)
+        confidence = _score(
+            definition_word_count + example_word_count,
+            bool(definition and example),
+            high_multiplier,
+            partial_multiplier,
+            max_confidence
+        )
+        return confidence, definition_word_count, example_word_count
+
     def calculate_confidence(self, definition: Optional[str], example: Optional[str]) -> float:
         """
         Calcula a confiança com base na presença e no comprimento da definição e do exemplo.
@@ -37,35 +145,97 @@ class ConfidenceModule:
         - float: Valor de confiança calculado, limitado por max_confidence.
         """
         try:
-            # Validar e tratar inputs
-            if not isinstance(definition, str):
+            # Validar e tratar inputs; a comparação de tipo exata resolve o caso comum sem percorrer a MRO
+            logger = self.logger
+            if type(definition) is not str and not isinstance(definition, str):
                 if definition is not None:
-                    self.logger.warning(f"Definição não é uma string: {definition}. Tratando como vazio.")
+                    logger.warning("Definição não é uma string: %s. Tratando como vazio.", definition)
                 definition = "" if definition is None else str(definition)
-            if not isinstance(example, str):
+            if type(example) is not str and not isinstance(example, str):
                 if example is not None:
-                    self.logger.warning(f"Exemplo não é uma string: {example}. Tratando como vazio.")
+                    logger.warning("Exemplo não é uma string: %s. Tratando como vazio.", example)
                 example = "" if example is None else str(example)
-            
-            # Contar palavras
-            definition_word_count = len(definition.split())
-            example_word_count = len(example.split())
-            total_word_count = definition_word_count + example_word_count
+
+            # Apenas entradas longas passam pelo cache; as curtas são recalculadas diretamente
+            compute = self._compute
+            if len(definition) + len(example) < self.CACHE_MIN_LENGTH:
+                compute = compute.__wrapped__
+            confidence, definition_word_count, example_word_count = compute(
+                definition, example, self.high_multiplier, self.partial_multiplier, self.max_confidence
+            )
 
             if definition and example:
-                confidence = min(self.max_confidence, total_word_count * self.high_multiplier)
-                self.logger.info(f"Confiança calculada: {confidence:.2f}% (Definição: {definition_word_count} palavras, Exemplo: {example_word_count} palavras).")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Confiança calculada: %.2f%% (Definição: %d palavras, Exemplo: %d palavras).",
+                        confidence, definition_word_count, example_word_count
+                    )
             elif definition or example:
-                single_word_count = definition_word_count if definition else example_word_count
-                confidence = min(self.max_confidence, single_word_count * self.partial_multiplier)
-                source = "definição" if definition else "exemplo"
-                self.logger.info(f"Confiança calculada: {confidence:.2f}% (Apenas {source}: {single_word_count} palavras).")
+                if logger.isEnabledFor(logging.INFO):
+                    single_word_count = definition_word_count if definition else example_word_count
+                    source = "definição" if definition else "exemplo"
+                    logger.info("Confiança calculada: %.2f%% (Apenas %s: %d palavras).", confidence, source, single_word_count)
             else:
-                confidence = 0.0
-                self.logger.warning("Definição e exemplo ausentes para calcular confiança.")
+                logger.warning("Definição e exemplo ausentes para calcular confiança.")
 
             return confidence
 
         except Exception as e:
             self.logger.error(f"Erro ao calcular confiança: {e}")
             return 0.0
+
+    def calculate_confidence_batch(
+        self,
+        definitions: Sequence[Optional[str]],
+        examples: Sequence[Optional[str]]
+    ) -> List[float]:
+        """
+        Calcula a confiança de vários pares (definição, exemplo) de uma só vez.
+
+        Aplica as mesmas regras de calculate_confidence, sem registrar uma mensagem por par.
+        Com NumPy disponível, as contagens são reunidas em arrays e a pontuação é calculada
+        de uma só vez para todos os pares.
+
+        Parâmetros:
+        - definitions (Sequence[Optional[str]]): Definições das palavras.
+        - examples (Sequence[Optional[str]]): Exemplos de uso, na mesma ordem das definições.
+
+        Retorna:
+        - List[float]: Valores de confiança, um por par.
+        """
+        if len(definitions) != len(examples):
+            raise ValueError("As listas de definições e exemplos devem ter o mesmo tamanho.")
+
+        high_multiplier = self.high_multiplier
+        partial_multiplier = self.partial_multiplier
+        max_confidence = self.max_confidence
+        count = len(definitions)
+        if np is not None and count:
+            definitions = [_as_text(definition) for definition in definitions]
+            examples = [_as_text(example) for example in examples]
+            totals = np.fromiter(
+                (_count_words(definition) + _count_words(example) for definition, example in zip(definitions, examples)),
+                dtype=np.int64, count=count
+            )
+            both_present = np.fromiter(
+                (bool(definition and example) for definition, example in zip(definitions, examples)),
+                dtype=bool, count=count
+            )
+            multipliers = np.where(both_present, high_multiplier, partial_multiplier)
+            scores = np.minimum(max_confidence, totals * multipliers).tolist()
+            self.logger.info(f"Confiança calculada em lote para {count} entradas.")
+            return scores
+
+        scores = []
+        for definition, example in zip(definitions, examples):
+            definition = _as_text(definition)
+            example = _as_text(example)
+            scores.append(_score(
+                _count_words(definition) + _count_words(example),
+                bool(definition and example),
+                high_multiplier,
+                partial_multiplier,
+                max_confidence
+            ))
+        self.logger.info(f"Confiança calculada em lote para {len(scores)} entradas.")
+        return scores
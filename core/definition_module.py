@@ -1,18 +1,34 @@
 # core/definition_module.py
 
-import json
-import os
 import logging
-from typing import Optional, Dict, Any
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Dict, Any, Mapping
+from . import storage
+
+if TYPE_CHECKING:
+    from .dictionary_manager import DictionaryManager
+
+# Logger compartilhado por todas as instâncias, com o mesmo nome usado antes
+_LOG = logging.getLogger('DefinitionModule')
 
 class DefinitionModule:
     """Módulo para buscar definições e exemplos no dicionário."""
 
+    # Quantidade máxima de exemplos mantidos em memória por instância
+    EXAMPLE_CACHE_SIZE = 4096
+
+    # Número de operações no journal a partir do qual o JSON é regravado por completo
+    JOURNAL_COMPACT_THRESHOLD = 1000
+
     def __init__(
         self,
         language: str = 'en',
         dictionary_path: str = 'data/dictionary_data.json',
-        language_data_path: str = 'data/language_data.json'
+        language_data_path: str = 'data/language_data.json',
+        autosave: bool = True,
+        dictionary_manager: Optional['DictionaryManager'] = None
     ):
         """
         Inicializa o DefinitionModule com o idioma especificado e caminhos para os dados.
@@ -21,55 +37,228 @@ class DefinitionModule:
         - language (str): Código do idioma (por exemplo, 'en', 'pt').
         - dictionary_path (str): Caminho para o arquivo JSON do dicionário.
         - language_data_path (str): Caminho para o arquivo JSON dos dados de idiomas.
+        - autosave (bool): Se True, salva o dicionário após cada alteração; se False, apenas em flush().
+        - dictionary_manager (DictionaryManager, optional): Gerenciador cujos dados são compartilhados.
+          Se informado, os arquivos não são lidos novamente: as consultas usam o dicionário e os dados
+          de idiomas já carregados por ele, e as alterações e gravações são delegadas a ele.
         """
         self.language = language
         self.dictionary_path = dictionary_path
         self.language_data_path = language_data_path
         
         # Inicializa o logger antes de chamar métodos que o utilizam
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger = _LOG
         self.logger.debug("Inicializando DefinitionModule.")
         
-        self.dictionary: Dict[str, Dict[str, Any]] = {}
-        self.language_data: Dict[str, Any] = {}
-        
-        self.load_language_data()
-        self.load_dictionary()
+        # Os arquivos só são lidos no primeiro acesso a `dictionary` ou `language_data`
+        self._dictionary: Dict[str, Dict[str, Any]] = {}
+        self._language_data: Dict[str, Any] = {}
+        self._dict_loaded = False
+        self._lang_loaded = False
+        # Gerenciador compartilhado (opcional) e a revisão dele refletida no estado local
+        self._manager = dictionary_manager
+        self._manager_revision: Optional[int] = None
+        # Referência direta ao subdicionário do idioma atual, evitando a busca externa a cada consulta
+        self._lang_dict: Dict[str, Any] = {}
+        # Revisão do conteúdo, incrementada a cada alteração; invalida o cache de exemplos
+        self._rev = 0
+        self._example_cache = lru_cache(maxsize=self.EXAMPLE_CACHE_SIZE)(self._lookup_example)
+
+        # Controle de gravação em lote: alterações pendentes e profundidade de blocos `with`
+        self.autosave = autosave
+        self._dirty = False
+        self._batch_depth = 0
+        # Operações registradas no journal desde a última gravação completa do JSON
+        self._journal_size = 0
+        # True se o último carregamento falhou; nesse caso o JSON não é regravado com o dicionário vazio
+        self._load_failed = False
+
+    def __enter__(self) -> 'DefinitionModule':
+        """Inicia um bloco de alterações em lote; o dicionário é salvo uma única vez ao final."""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Encerra o bloco de alterações em lote, salvando as alterações pendentes."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Salva o dicionário se houver alterações pendentes.
+
+        Retorna:
+        - bool: True se não havia pendências ou se o salvamento foi bem-sucedido, False em caso de erro.
+        """
+        if not self._dirty:
+            return True
+        return self.save_dictionary()
+
+    def _mark_dirty(self, record: Dict[str, Any]) -> None:
+        """
+        Registra uma alteração e a persiste imediatamente, exceto em lote ou com autosave desativado.
+
+        Fora de lote, a alteração é apenas acrescentada ao journal; o JSON completo só é regravado
+        quando o journal atinge JOURNAL_COMPACT_THRESHOLD operações ou em compact().
+
+        Parâmetros:
+        - record (Dict[str, Any]): Operação realizada ('op', 'lang', 'word' e, na adição, 'entry').
+        """
+        if not self.autosave or self._batch_depth:
+            self._dirty = True
+            return
+        if self._dirty:
+            # Há alterações anteriores fora do journal; só uma gravação completa as inclui
+            self.save_dictionary()
+            return
+        try:
+            storage.append_journal(record, self.dictionary_path)
+        except Exception as e:
+            self.logger.error(f"Erro ao registrar a alteração no journal: {e}")
+            self._dirty = True
+            return
+        self._journal_size += 1
+        if self._journal_size >= self.JOURNAL_COMPACT_THRESHOLD:
+            self.compact()
+
+    def compact(self) -> bool:
+        """
+        Regrava o JSON completo com o estado atual e descarta o journal de alterações.
+
+        Retorna:
+        - bool: True se salvo com sucesso, False em caso de erro.
+        """
+        self._ensure_loaded()
+        return self.save_dictionary()
+
+    @property
+    def dictionary(self) -> Dict[str, Dict[str, Any]]:
+        """Dicionário completo, carregado do arquivo JSON no primeiro acesso."""
+        self._ensure_loaded()
+        return self._dictionary
+
+    @dictionary.setter
+    def dictionary(self, value: Dict[str, Dict[str, Any]]) -> None:
+        self._dictionary = value
+        self._dict_loaded = True
+        self._rev += 1
+        self._refresh_lang_dict()
+
+    @property
+    def language_data(self) -> Dict[str, Any]:
+        """Dados dos idiomas, carregados do arquivo JSON no primeiro acesso."""
+        if not self._lang_loaded:
+            self.load_language_data()
+        return self._language_data
+
+    @language_data.setter
+    def language_data(self, value: Dict[str, Any]) -> None:
+        self._language_data = value
+        self._lang_loaded = True
+
+    def _ensure_loaded(self) -> None:
+        """Carrega o dicionário no primeiro acesso ou, com gerenciador compartilhado, acompanha as alterações dele."""
+        if self._manager is not None:
+            if self._manager_revision != self._manager.revision:
+                self.load_dictionary()
+        elif not self._dict_loaded:
+            self.load_dictionary()
 
     def load_dictionary(self) -> None:
         """
         Carrega o dicionário a partir do arquivo JSON.
 
-        Se o arquivo não for encontrado ou contiver JSON inválido, o dicionário será vazio.
+        Se existir um snapshot binário correspondente ao JSON atual, ele é usado no lugar do JSON.
+        Se o arquivo não for encontrado ou contiver JSON inválido, o dicionário será vazio; se o arquivo
+        existir mas não puder ser lido, save_dictionary() deixa de gravar até um novo carregamento bem-sucedido.
+        Com um gerenciador compartilhado, apenas passa a referenciar o dicionário já carregado por ele.
         """
+        if self._manager is not None:
+            self._manager_revision = self._manager.revision
+            self.dictionary = self._manager.dictionary
+            return
         try:
-            with open(self.dictionary_path, 'r', encoding='utf-8') as file:
-                self.dictionary = json.load(file)
+            dictionary = storage.load_snapshot(self.dictionary_path)
+            if dictionary is None:
+                dictionary = storage.load_json(self.dictionary_path)
+            # O snapshot pode ter sido gravado pelo DictionaryManager, que não normaliza as chaves, e o
+            # pickle não preserva strings internadas; por isso os dois caminhos passam pela normalização
+            dictionary = self._share_values(self._normalize_keys(dictionary))
+            self._journal_size = storage.replay_journal(dictionary, self.dictionary_path)
+            self.dictionary = dictionary
+            self._load_failed = False
             self.logger.info("Dicionário carregado com sucesso.")
         except FileNotFoundError:
             self.logger.error(f"Arquivo {self.dictionary_path} não encontrado. Usando dicionário vazio.")
             self.dictionary = {}
-        except json.JSONDecodeError as e:
+            self._load_failed = False
+        except storage.JSONDecodeError as e:
             self.logger.error(f"Erro ao decodificar JSON em {self.dictionary_path}: {e}. Usando dicionário vazio.")
             self.dictionary = {}
+            self._load_failed = True
         except Exception as e:
             self.logger.error(f"Erro inesperado ao carregar o dicionário: {e}. Usando dicionário vazio.")
             self.dictionary = {}
+            self._load_failed = True
+
+    @staticmethod
+    def _normalize_keys(dictionary: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Converte as chaves de palavras para minúsculas uma única vez, no carregamento.
+
+        Assim as consultas com entrada já normalizada não precisam chamar word.lower().
+        """
+        return {
+            language: {word.lower(): entry for word, entry in entries.items()}
+            for language, entries in dictionary.items()
+        }
+
+    @staticmethod
+    def _share_values(dictionary: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Faz entradas com o mesmo texto compartilharem um único objeto string.
+
+        As classes gramaticais vêm de um vocabulário pequeno e são internadas com sys.intern;
+        definições idênticas passam a apontar para a mesma string.
+        """
+        definitions: Dict[str, str] = {}
+        for entries in dictionary.values():
+            for entry in entries.values():
+                part_of_speech = entry.get('part_of_speech')
+                if isinstance(part_of_speech, str):
+                    entry['part_of_speech'] = sys.intern(part_of_speech)
+                definition = entry.get('definition')
+                if isinstance(definition, str):
+                    entry['definition'] = definitions.setdefault(definition, definition)
+        return dictionary
+
+    def _refresh_lang_dict(self) -> None:
+        """Atualiza a referência ao subdicionário do idioma atual."""
+        # Usa o atributo interno para não disparar o carregamento; load_dictionary chama este método
+        if self._manager is not None:
+            # O dicionário pertence ao gerenciador; não cria idiomas vazios nele
+            self._lang_dict = self._dictionary.get(self.language, {})
+        else:
+            self._lang_dict = self._dictionary.setdefault(self.language, {})
 
     def load_language_data(self) -> None:
         """
         Carrega os dados dos idiomas a partir do arquivo JSON.
 
         Se o arquivo não for encontrado ou contiver JSON inválido, os dados de idiomas serão vazios.
+        Com um gerenciador compartilhado, usa os dados de idiomas já carregados por ele.
         """
+        if self._manager is not None:
+            self.language_data = self._manager.language_data
+            return
         try:
-            with open(self.language_data_path, 'r', encoding='utf-8') as file:
-                self.language_data = json.load(file)
+            self.language_data = storage.load_json(self.language_data_path)
             self.logger.info("Dados de idiomas carregados com sucesso.")
         except FileNotFoundError:
             self.logger.error(f"Arquivo {self.language_data_path} não encontrado. Dados de idiomas vazios.")
             self.language_data = {}
-        except json.JSONDecodeError as e:
+        except storage.JSONDecodeError as e:
             self.logger.error(f"Erro ao decodificar JSON em {self.language_data_path}: {e}. Dados de idiomas vazios.")
             self.language_data = {}
         except Exception as e:
@@ -78,7 +267,7 @@ class DefinitionModule:
 
     def set_language(self, language: str) -> None:
         """
-        Define o idioma atual e recarrega o dicionário se necessário.
+        Define o idioma atual e aponta as consultas para o subdicionário correspondente.
 
         Parâmetros:
         - language (str): Código do idioma (por exemplo, 'en', 'pt').
@@ -93,31 +282,48 @@ class DefinitionModule:
 
         self.language = language
         self.logger.info(f"Idioma definido para '{language}'.")
-        self.load_dictionary()
+        # O dicionário carregado já contém todos os idiomas; basta trocar a referência
+        self._refresh_lang_dict()
 
-    def get_definition(self, word: str) -> Optional[Dict[str, Any]]:
+    def get_definition(self, word: str) -> Optional[Mapping[str, Any]]:
         """
         Retorna a definição e parte do discurso da palavra.
 
+        A entrada é devolvida como uma visão somente leitura do dicionário interno, sem cópia;
+        alterações devem passar por add_word e remove_word.
+
         Parâmetros:
         - word (str): Palavra para buscar a definição.
 
         Retorna:
-        - Optional[Dict[str, Any]]: Dicionário com 'definition' e 'part_of_speech' se a palavra existir, caso contrário None.
+        - Optional[Mapping[str, Any]]: Mapeamento com 'definition' e 'part_of_speech' se a palavra existir, caso contrário None.
         """
-        if not isinstance(word, str) or not word.strip():
-            self.logger.warning(f"Entrada inválida para get_definition: {word}")
+        if (type(word) is not str and not isinstance(word, str)) or not word.strip():
+            self.logger.warning("Entrada inválida para get_definition: %s", word)
             return None
 
-        word = word.lower()
-        language_dict = self.dictionary.get(self.language, {})
-        definition_data = language_dict.get(word)
+        self._ensure_loaded()
 
-        if definition_data:
-            self.logger.debug(f"Definição encontrada para '{word}' no idioma '{self.language}'.")
-        else:
-            self.logger.debug(f"Definição para '{word}' não encontrada no idioma '{self.language}'.")
-        return definition_data
+        # As chaves já estão em minúsculas; só normaliza a entrada se a busca direta falhar.
+        # Acertos são o caso comum, então o bloco try não tem custo no caminho principal.
+        language_dict = self._lang_dict
+        logger = self.logger
+        try:
+            try:
+                definition_data = language_dict[word]
+            except KeyError:
+                word = word.lower()
+                definition_data = language_dict[word]
+        except KeyError:
+            # Evita formatar mensagens de depuração quando o nível DEBUG está desativado
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Definição para '%s' não encontrada no idioma '%s'.", word, self.language)
+            return None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Definição encontrada para '%s' no idioma '%s'.", word, self.language)
+        # As entradas continuam dicts para serem serializáveis; a visão é criada apenas no retorno
+        return MappingProxyType(definition_data)
 
     def get_example(self, word: str) -> str:
         """
@@ -129,25 +335,52 @@ class DefinitionModule:
         Retorna:
         - str: Exemplo de uso ou mensagem padrão se não encontrado.
         """
-        if not isinstance(word, str) or not word.strip():
-            self.logger.warning(f"Entrada inválida para get_example: {word}")
+        if (type(word) is not str and not isinstance(word, str)) or not word.strip():
+            self.logger.warning("Entrada inválida para get_example: %s", word)
+            return f"Exemplo de uso para '{word}' não encontrado."
+
+        self._ensure_loaded()
+        example = self._example_cache(self.language, word, self._rev)
+        if example is not None:
+            self.logger.debug("Exemplo encontrado para '%s'.", word)
+            return example
+        else:
+            self.logger.info("Exemplo de uso para '%s' não encontrado.", word)
             return f"Exemplo de uso para '{word}' não encontrado."
 
+    def _lookup_example(self, language: str, word: str, rev: int) -> Optional[str]:
+        """
+        Busca o exemplo de uso da palavra no dicionário, sem a mensagem padrão.
+
+        Os argumentos language e rev fazem parte da chave do cache: trocar de idioma ou
+        alterar o dicionário faz com que os resultados anteriores deixem de ser usados.
+
+        Parâmetros:
+        - language (str): Idioma da consulta.
+        - word (str): Palavra para buscar o exemplo.
+        - rev (int): Revisão do dicionário no momento da consulta.
+
+        Retorna:
+        - Optional[str]: Exemplo de uso, ou None se não houver.
+        """
         definition_data = self.get_definition(word)
         if definition_data and 'example' in definition_data and definition_data['example'].strip():
-            self.logger.debug(f"Exemplo encontrado para '{word}'.")
             return definition_data['example']
-        else:
-            self.logger.info(f"Exemplo de uso para '{word}' não encontrado.")
-            return f"Exemplo de uso para '{word}' não encontrado."
+        return None
 
     def reload_dictionary(self) -> None:
         """
         Recarrega o dicionário a partir do arquivo JSON.
 
         Útil se o arquivo de dicionário for atualizado durante a execução do programa.
+        Alterações ainda não salvas são descartadas.
         """
+        if self._dirty:
+            self.logger.warning("Recarregando o dicionário com alterações não salvas; elas serão descartadas.")
+            self._dirty = False
         self.logger.info("Recarregando o dicionário.")
+        if self._manager is not None:
+            self._manager.load_data()
         self.load_dictionary()
 
     def reload_language_data(self) -> None:
@@ -190,31 +423,48 @@ class DefinitionModule:
             )
             return False
 
+        self._ensure_loaded()
+
         word = word.lower()
-        language_dict = self.dictionary.setdefault(self.language, {})
+        language_dict = self._lang_dict
         if word in language_dict:
             self.logger.warning(f"Palavra '{word}' já existe no dicionário para o idioma '{self.language}'.")
             return False
 
-        language_dict[word] = {
+        entry = {
             'definition': definition.strip(),
-            'part_of_speech': part_of_speech.strip(),
+            'part_of_speech': sys.intern(part_of_speech.strip()),
             'example': example.strip() if example and isinstance(example, str) else ""
         }
+        if self._manager is not None:
+            # O gerenciador mantém índice, journal e CSV; a revisão dele sincroniza este módulo na próxima consulta
+            self._manager.store_entry(self.language, word, entry)
+            self.logger.info(f"Palavra '{word}' adicionada com sucesso ao dicionário para o idioma '{self.language}'.")
+            return True
+        language_dict[word] = entry
+        self._rev += 1
         self.logger.info(f"Palavra '{word}' adicionada com sucesso ao dicionário para o idioma '{self.language}'.")
-        self.save_dictionary()
+        self._mark_dirty({'op': 'add', 'lang': self.language, 'word': word, 'entry': entry})
         return True
 
     def save_dictionary(self) -> bool:
         """
-        Salva o dicionário de volta para o arquivo JSON.
+        Salva o dicionário de volta para o arquivo JSON, atualiza o snapshot binário e descarta o journal.
 
         Retorna:
         - bool: True se salvo com sucesso, False em caso de erro.
         """
+        if self._manager is not None:
+            return self._manager.save_data()
+        if self._load_failed:
+            self.logger.error("Carregamento do dicionário falhou; salvamento cancelado para não sobrescrever o arquivo.")
+            return False
         try:
-            with open(self.dictionary_path, 'w', encoding='utf-8') as file:
-                json.dump(self.dictionary, file, ensure_ascii=False, indent=4)
+            storage.dump_json(self.dictionary, self.dictionary_path)
+            storage.write_snapshot(self.dictionary, self.dictionary_path)
+            storage.truncate_journal(self.dictionary_path)
+            self._journal_size = 0
+            self._dirty = False
             self.logger.info("Dicionário salvo com sucesso.")
             return True
         except Exception as e:
@@ -235,13 +485,19 @@ class DefinitionModule:
             self.logger.error(f"Entrada inválida para remover palavra: '{word}'.")
             return False
 
+        if self._manager is not None:
+            success, _ = self._manager.remove_word(word, self.language)
+            return success
+
+        self._ensure_loaded()
+
         word = word.lower()
-        language_dict = self.dictionary.get(self.language, {})
-        if word not in language_dict:
+        try:
+            del self._lang_dict[word]
+        except KeyError:
             self.logger.warning(f"Palavra '{word}' não encontrada no dicionário para o idioma '{self.language}'.")
             return False
-
-        del language_dict[word]
+        self._rev += 1
         self.logger.info(f"Palavra '{word}' removida com sucesso do dicionário para o idioma '{self.language}'.")
-        self.save_dictionary()
+        self._mark_dirty({'op': 'remove', 'lang': self.language, 'word': word})
         return True
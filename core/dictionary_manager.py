@@ -1,22 +1,157 @@
 # core/dictionary_manager.py
 
-import json
+import bisect
 import os
+import re
+import sys
 import logging
 import requests
-import shutil
-from datetime import datetime
-from typing import Tuple, Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple, Optional, Dict, Any, Iterable, List, Mapping, Sequence, Set
 from .confidence_module import ConfidenceModule  # Importação absoluta
+from . import storage
 import csv
 
+# Formato aceito para novas palavras: letras (de qualquer alfabeto), com hífens, apóstrofos
+# ou espaços simples entre elas (expressões como "ice cream")
+_WORD_RE = re.compile(r"\A[^\W\d_]+(?:[-' ][^\W\d_]+)*\Z")
+
+def _norm_key(text: str) -> str:
+    """
+    Normaliza uma palavra ou código de idioma para uso como chave do dicionário.
+
+    Parâmetros:
+    - text (str): Texto informado pelo usuário.
+
+    Retorna:
+    - str: Texto em minúsculas e sem espaços nas bordas (vazio se não restar nada).
+    """
+    return text.strip().lower()
+
+def _normalize_row(word: str, definition: str, part_of_speech: str, example: str) -> Tuple[str, str, str, str]:
+    """
+    Normaliza os campos de um registro do dicionário.
+
+    Parâmetros:
+    - word (str): Palavra; é convertida para minúsculas.
+    - definition (str): Definição da palavra.
+    - part_of_speech (str): Classe gramatical da palavra.
+    - example (str): Exemplo de uso da palavra.
+
+    Retorna:
+    - tuple: (palavra, definição, classe gramatical, exemplo), sem espaços nas bordas.
+    """
+    return _norm_key(word), definition.strip(), part_of_speech.strip(), example.strip()
+
+def _arrow_rows(batches: Iterable[Dict[str, List[Optional[str]]]]) -> Iterable[Tuple[str, ...]]:
+    """
+    Percorre, lote a lote, os registros de colunas lidas pelo PyArrow.
+
+    Parâmetros:
+    - batches (Iterable[dict]): Lotes com as colunas 'word', 'definition', 'part_of_speech' e,
+      opcionalmente, 'example'.
+
+    Retorna:
+    - Iterable[tuple]: Registros (palavra, definição, classe gramatical, exemplo).
+    """
+    for batch in batches:
+        words = batch['word']
+        examples = batch.get('example') or [None] * len(words)
+        # Campos nulos do Arrow viram strings vazias, como as células vazias do leitor csv
+        for row in zip(words, batch['definition'], batch['part_of_speech'], examples):
+            yield tuple(value or '' for value in row)
+
+def _extract_first_definition(data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Extrai a primeira definição de uma resposta da API de dicionário.
+
+    Lê apenas o caminho data[0]['meanings'][0]['definitions'][0], interrompendo a leitura
+    no primeiro nível ausente ou com formato inesperado.
+
+    Parâmetros:
+    - data (Any): Resposta da API já decodificada.
+
+    Retorna:
+    - dict: Contendo 'definition', 'part_of_speech' e 'example'.
+    - None: Se a resposta não contiver uma definição.
+    """
+    try:
+        first_meaning = data[0]['meanings'][0]
+        first_definition = first_meaning['definitions'][0]
+        return {
+            'definition': first_definition.get('definition', 'Definição não disponível.'),
+            'part_of_speech': first_meaning.get('partOfSpeech', 'N/A'),
+            'example': first_definition.get('example', 'Exemplo não disponível.')
+        }
+    except (IndexError, KeyError, TypeError, AttributeError):
+        return None
+
+class _DefinitionNotFound(Exception):
+    """Sinaliza que a API não retornou definição; como exceção, o resultado não entra no cache."""
+
 class DictionaryManager:
     """
     Classe responsável por gerenciar a adição de novas palavras ao dicionário.
     Inclui funcionalidades para buscar definições via API, adicionar palavras manualmente,
     salvar e carregar dados do dicionário e dos idiomas, além de validar a integridade dos dados.
+
+    Adições e remoções individuais são registradas em um journal ao lado do JSON do dicionário;
+    o JSON completo (com backup) só é regravado em save_data(), compact() ou close().
     """
 
+    # Número de operações no journal a partir do qual o JSON é regravado por completo
+    JOURNAL_COMPACT_THRESHOLD = 1000
+
+    # Idiomas gravados em language_data.json quando o arquivo ainda não existe
+    DEFAULT_LANGUAGES = {
+        "en": {
+            "name": "English",
+            "code": "en-US",
+            "gtts_code": "en"
+        },
+        "pt": {
+            "name": "Português",
+            "code": "pt-BR",
+            "gtts_code": "pt"
+        },
+        "es": {
+            "name": "Español",
+            "code": "es-ES",
+            "gtts_code": "es"
+        },
+        "fr": {
+            "name": "Français",
+            "code": "fr-FR",
+            "gtts_code": "fr"
+        }
+    }
+
+    # Quantidade de backups mantidos para cada arquivo de dados
+    BACKUP_RETENTION = 10
+
+    # Número de remoções pendentes a partir do qual o CSV de exportação é regerado
+    CSV_REBUILD_THRESHOLD = 64
+
+    # Conexões HTTP mantidas abertas para a API de dicionário e política de novas tentativas
+    HTTP_POOL_SIZE = 10
+    HTTP_RETRIES = Retry(total=2, backoff_factor=0.2)
+
+    # Quantidade máxima de respostas da API e de consultas ao dicionário mantidas em memória
+    FETCH_CACHE_SIZE = 4096
+    DEFINITION_CACHE_SIZE = 4096
+
+    # Colunas do CSV de exportação
+    CSV_FIELDNAMES = ['word', 'definition', 'part_of_speech', 'example']
+
+    # Tamanho do buffer de escrita do CSV de exportação, agrupando as chamadas de sistema
+    CSV_BUFFER_SIZE = 1 << 20
+
     def __init__(
         self,
         dictionary_path: str = 'data/dictionary_data.json',
@@ -36,124 +171,395 @@ class DictionaryManager:
         self.export_csv_path = export_csv_path
         self.logger = logging.getLogger(self.__class__.__name__)
         self.confidence_module = ConfidenceModule()
+        # Operações registradas no journal desde a última gravação completa do dicionário
+        self._journal_size = 0
+        # True se o último carregamento falhou; nesse caso os arquivos não são regravados com dados vazios
+        self._load_failed = False
+        # Estado do CSV de exportação: idioma que ele contém e palavras removidas que ainda constam nele
+        self._csv_language: Optional[str] = None
+        self._csv_removed: Set[str] = set()
+        # Controle de gravação em lote: alterações fora do journal, idiomas do CSV a regerar
+        # (na ordem da última alteração) e profundidade de blocos `with`
+        self._dirty = False
+        self._batch_csv_languages: Dict[str, None] = {}
+        self._batch_depth = 0
+        # Serializa gravações de arquivos (JSON, journal, backups e CSV) entre threads
+        self._io_lock = threading.RLock()
+        # Sessão HTTP reutilizada entre consultas, evitando um novo handshake TCP/TLS por palavra
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=self.HTTP_POOL_SIZE,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            max_retries=self.HTTP_RETRIES
+        ))
+        # Respostas bem-sucedidas da API, por (palavra, idioma); falhas não são armazenadas
+        self._fetch_cached = lru_cache(maxsize=self.FETCH_CACHE_SIZE)(self._fetch_uncached)
+        # Resultados de get_definition por (idioma, palavra normalizada); cada alteração descarta só as palavras afetadas
+        self._defn_cache: Dict[Tuple[str, str], Optional[Mapping[str, Any]]] = {}
+        # Revisão do conteúdo do dicionário, incrementada a cada alteração
+        self.revision = 0
+        # Palavras de cada idioma já ordenadas, mantidas em ordem a cada adição e remoção
+        self._sorted_words: Dict[str, List[str]] = {}
+        self._dictionary: Dict[str, Dict[str, Any]] = {}
+        self._language_data: Dict[str, Any] = {}
+        # Códigos dos idiomas disponíveis, calculados na primeira consulta a available_languages()
+        self._languages: Optional[Tuple[str, ...]] = None
         self.ensure_files_exist()
         self.load_data()
 
+    def __enter__(self) -> 'DictionaryManager':
+        """
+        Inicia um bloco de alterações em lote: nada é gravado no journal nem no CSV de exportação
+        até o fim do bloco, quando o dicionário é salvo e o CSV regerado uma única vez.
+        """
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Encerra o bloco de alterações em lote, gravando as alterações pendentes."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Salva o dicionário e regera o CSV de exportação se houver alterações feitas em lote.
+
+        Retorna:
+        - bool: True se não havia pendências ou se tudo foi gravado com sucesso, False caso contrário.
+        """
+        with self._io_lock:
+            success = True
+            if self._dirty:
+                success = self.save_data()
+                if success:
+                    self._dirty = False
+            languages = list(self._batch_csv_languages)
+            self._batch_csv_languages.clear()
+            # Cada idioma alterado é exportado, na ordem em que foi alterado por último: o arquivo termina
+            # com o mesmo idioma que teria se as alterações tivessem sido feitas fora do bloco
+            for language in languages:
+                success = self.export_dictionary_to_csv(language, self.export_csv_path) and success
+            return success
+
+    @property
+    def dictionary(self) -> Dict[str, Dict[str, Any]]:
+        """Dicionário por idioma e palavra."""
+        return self._dictionary
+
+    @dictionary.setter
+    def dictionary(self, value: Dict[str, Dict[str, Any]]) -> None:
+        self._dictionary = value
+        self._sorted_words.clear()
+        self._invalidate()
+
+    @property
+    def language_data(self) -> Dict[str, Any]:
+        """Dados dos idiomas disponíveis, por código de idioma."""
+        return self._language_data
+
+    @language_data.setter
+    def language_data(self, value: Dict[str, Any]) -> None:
+        self._language_data = value
+        self._languages = None
+
+    def available_languages(self) -> Tuple[str, ...]:
+        """
+        Retorna os códigos dos idiomas disponíveis, na ordem de language_data.json.
+
+        Retorna:
+        - tuple: Códigos dos idiomas (ex: ('en', 'pt')).
+        """
+        languages = self._languages
+        if languages is None:
+            languages = self._languages = tuple(self._language_data)
+        return languages
+
+    def _invalidate(self) -> None:
+        """Descarta todas as consultas em cache e avança a revisão após a substituição do dicionário."""
+        self._defn_cache.clear()
+        self.revision += 1
+
+    def _invalidate_words(self, language: str, words: Iterable[str]) -> None:
+        """
+        Descarta as consultas em cache das palavras alteradas e avança a revisão do dicionário.
+
+        Parâmetros:
+        - language (str): Código do idioma.
+        - words (Iterable[str]): Palavras já normalizadas que foram adicionadas ou removidas.
+        """
+        for word in words:
+            self._defn_cache.pop((language, word), None)
+        self.revision += 1
+
+    def _index_add(self, language: str, word: str) -> None:
+        """Insere a palavra na lista ordenada do idioma, se ela já tiver sido construída."""
+        words = self._sorted_words.get(language)
+        if words is not None:
+            bisect.insort(words, word)
+
+    def _sorted(self, language: str) -> List[str]:
+        """Retorna a lista ordenada de palavras do idioma, construindo-a na primeira consulta."""
+        words = self._sorted_words.get(language)
+        if words is None:
+            words = self._sorted_words[language] = sorted(self.dictionary[language])
+        return words
+
+    def _index_remove(self, language: str, word: str) -> None:
+        """Remove a palavra da lista ordenada do idioma, se ela já tiver sido construída."""
+        words = self._sorted_words.get(language)
+        if words is not None:
+            position = bisect.bisect_left(words, word)
+            if position < len(words) and words[position] == word:
+                del words[position]
+
     def ensure_files_exist(self) -> None:
         """
         Garante que os arquivos de dados existam.
         Se não existirem, cria-os com conteúdo padrão.
         Também garante que o diretório de exportação exista.
+
+        Cada arquivo é criado com uma única chamada exclusiva, sem verificar a existência antes.
         """
-        # Verificar e criar dictionary_data.json
-        if not os.path.exists(self.dictionary_path):
-            try:
-                with open(self.dictionary_path, 'w', encoding='utf-8') as file:
-                    json.dump({}, file, ensure_ascii=False, indent=4)
-                self.logger.info(f"Arquivo '{self.dictionary_path}' criado com conteúdo padrão.")
-            except Exception as e:
-                self.logger.error(f"Erro ao criar '{self.dictionary_path}': {e}")
-        
-        # Verificar e criar language_data.json
-        if not os.path.exists(self.language_data_path):
-            default_languages = {
-                "en": {
-                    "name": "English",
-                    "code": "en-US",
-                    "gtts_code": "en"
-                },
-                "pt": {
-                    "name": "Português",
-                    "code": "pt-BR",
-                    "gtts_code": "pt"
-                },
-                "es": {
-                    "name": "Español",
-                    "code": "es-ES",
-                    "gtts_code": "es"
-                },
-                "fr": {
-                    "name": "Français",
-                    "code": "fr-FR",
-                    "gtts_code": "fr"
-                }
-            }
+        # Criar dictionary_data.json e language_data.json, se ainda não existirem
+        for path, default_content, description in (
+            (self.dictionary_path, {}, "conteúdo padrão"),
+            (self.language_data_path, self.DEFAULT_LANGUAGES, "idiomas padrão"),
+        ):
             try:
-                with open(self.language_data_path, 'w', encoding='utf-8') as file:
-                    json.dump(default_languages, file, ensure_ascii=False, indent=4)
-                self.logger.info(f"Arquivo '{self.language_data_path}' criado com idiomas padrão.")
+                if storage.create_json(default_content, path):
+                    self.logger.info(f"Arquivo '{path}' criado com {description}.")
             except Exception as e:
-                self.logger.error(f"Erro ao criar '{self.language_data_path}': {e}")
+                self.logger.error(f"Erro ao criar '{path}': {e}")
 
-        # Verificar e criar a pasta de exportação se não existir
+        # Criar a pasta de exportação se não existir
         export_dir = os.path.dirname(self.export_csv_path)
-        if not os.path.exists(export_dir):
+        if export_dir:
             try:
-                os.makedirs(export_dir)
-                self.logger.info(f"Diretório de exportação '{export_dir}' criado com sucesso.")
+                os.makedirs(export_dir, exist_ok=True)
             except Exception as e:
                 self.logger.error(f"Erro ao criar diretório de exportação '{export_dir}': {e}")
 
     def load_data(self) -> None:
         """
         Carrega os dados do dicionário e dos idiomas a partir dos arquivos JSON.
-        Se ocorrer algum erro durante o carregamento, os dados são inicializados como vazios.
+        Se existir um snapshot binário correspondente ao JSON atual do dicionário, ele é usado no lugar do JSON.
+        As operações pendentes no journal são aplicadas ao dicionário carregado.
+        Se ocorrer algum erro durante o carregamento, os dados são inicializados como vazios
+        e save_data() deixa de gravar até um novo carregamento bem-sucedido, preservando os arquivos.
         """
         try:
-            with open(self.dictionary_path, 'r', encoding='utf-8') as file:
-                self.dictionary = json.load(file)
-            with open(self.language_data_path, 'r', encoding='utf-8') as file:
-                self.language_data = json.load(file)
+            dictionary = storage.load_snapshot(self.dictionary_path)
+            if dictionary is None:
+                dictionary = storage.load_json(self.dictionary_path)
+            dictionary = self._intern_strings(dictionary)
+            self._journal_size = storage.replay_journal(dictionary, self.dictionary_path)
+            self.dictionary = dictionary
+            self.language_data = storage.load_json(self.language_data_path)
+            self._load_failed = False
             self.logger.info("Dados do dicionário e idiomas carregados com sucesso.")
         except FileNotFoundError as e:
             self.logger.error(f"Arquivo não encontrado durante o carregamento: {e}")
             self.dictionary = {}
             self.language_data = {}
-        except json.JSONDecodeError as e:
+            self._load_failed = True
+        except storage.JSONDecodeError as e:
             self.logger.error(f"Erro ao decodificar JSON durante o carregamento: {e}")
             self.dictionary = {}
             self.language_data = {}
+            self._load_failed = True
         except Exception as e:
             self.logger.error(f"Erro desconhecido durante o carregamento dos dados: {e}")
             self.dictionary = {}
             self.language_data = {}
+            self._load_failed = True
+
+    @staticmethod
+    def _intern_strings(dictionary: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Interna os códigos de idioma e as classes gramaticais do dicionário carregado.
+
+        Esses valores vêm de vocabulários pequenos; internados, cada valor distinto existe
+        uma única vez em memória, e as comparações entre eles se reduzem a comparar ponteiros.
+        """
+        interned = {}
+        for language, entries in dictionary.items():
+            for entry in entries.values():
+                part_of_speech = entry.get('part_of_speech')
+                if isinstance(part_of_speech, str):
+                    entry['part_of_speech'] = sys.intern(part_of_speech)
+            interned[sys.intern(language)] = entries
+        return interned
 
     def save_data(self) -> bool:
         """
         Salva os dados atualizados do dicionário e dos idiomas nos arquivos JSON.
-        Antes de salvar, cria backups dos arquivos atuais.
-        Após salvar, valida os arquivos JSON.
+        Antes de salvar, cria backups dos arquivos atuais, mantendo apenas os BACKUP_RETENTION mais recentes
+        entre os criados aqui; os backups antigos versionados em data/ não são removidos.
+        Após salvar, atualiza o snapshot binário do dicionário e descarta o journal, já incorporado ao dicionário.
+
+        Os arquivos não são relidos para validação: o conteúdo vem de objetos já serializados com
+        sucesso e é gravado de forma atômica. Use validate_json() para verificar um arquivo externo.
+
+        Se o último carregamento falhou, nada é gravado: os dados em memória estão vazios e
+        sobrescreveriam os arquivos que não puderam ser lidos.
         
         Retorna:
         - bool: True se salvo com sucesso, False caso contrário.
         """
-        try:
-            # Criação de backups com timestamp
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            backup_dict_path = f"{self.dictionary_path}.backup.{timestamp}"
-            backup_lang_path = f"{self.language_data_path}.backup.{timestamp}"
+        with self._io_lock:
+            if self._load_failed:
+                self.logger.error("Carregamento dos dados falhou; salvamento cancelado para não sobrescrever os arquivos.")
+                return False
+            try:
+                # Criação de backups com sufixo em nanossegundos: crescente e sem custo de formatação de data
+                timestamp = time.time_ns()
+                backup_dict_path = f"{self.dictionary_path}.backup.{timestamp}"
+                backup_lang_path = f"{self.language_data_path}.backup.{timestamp}"
             
-            shutil.copy(self.dictionary_path, backup_dict_path)
-            shutil.copy(self.language_data_path, backup_lang_path)
-            self.logger.info(f"Backups criados: '{backup_dict_path}', '{backup_lang_path}'.")
+                storage.backup_file(self.dictionary_path, backup_dict_path)
+                storage.backup_file(self.language_data_path, backup_lang_path)
+                self.logger.info(f"Backups criados: '{backup_dict_path}', '{backup_lang_path}'.")
+                storage.prune_backups(self.dictionary_path, self.BACKUP_RETENTION)
+                storage.prune_backups(self.language_data_path, self.BACKUP_RETENTION)
     
-            # Salvando os dados atualizados
-            with open(self.dictionary_path, 'w', encoding='utf-8') as file:
-                json.dump(self.dictionary, file, ensure_ascii=False, indent=4)
-            with open(self.language_data_path, 'w', encoding='utf-8') as file:
-                json.dump(self.language_data, file, ensure_ascii=False, indent=4)
-            self.logger.info("Dados do dicionário e idiomas salvos com sucesso.")
-    
-            # Validação pós-salvamento
-            if self.validate_json(self.dictionary_path) and self.validate_json(self.language_data_path):
-                self.logger.info("Validação dos arquivos JSON concluída com sucesso.")
-            else:
-                self.logger.error("Validação dos arquivos JSON falhou.")
+                # Salvando os dados atualizados
+                storage.dump_json(self.dictionary, self.dictionary_path)
+                storage.dump_json(self.language_data, self.language_data_path)
+                storage.write_snapshot(self.dictionary, self.dictionary_path)
+                storage.truncate_journal(self.dictionary_path)
+                self._journal_size = 0
+                self.logger.info("Dados do dicionário e idiomas salvos com sucesso.")
+                return True
+            except Exception as e:
+                self.logger.error(f"Erro ao salvar dados: {e}")
                 return False
+
+    def _record_change(self, record: Dict[str, Any]) -> bool:
+        """
+        Persiste uma única alteração do dicionário acrescentando-a ao journal.
+
+        Se o journal não puder ser gravado, recorre à gravação completa com save_data().
+
+        Parâmetros:
+        - record (Dict[str, Any]): Operação realizada ('op', 'lang', 'word' e, na adição, 'entry').
+
+        Retorna:
+        - bool: True se a alteração foi persistida, False caso contrário.
+        """
+        with self._io_lock:
+            if self._batch_depth:
+                # Em lote, a alteração entra na gravação única feita ao fim do bloco
+                self._dirty = True
+                return True
+            try:
+                storage.append_journal(record, self.dictionary_path)
+            except Exception as e:
+                self.logger.error(f"Erro ao registrar alteração no journal: {e}. Salvando o dicionário completo.")
+                return self.save_data()
+            self._journal_size += 1
+            if self._journal_size >= self.JOURNAL_COMPACT_THRESHOLD:
+                return self.compact()
             return True
-        except Exception as e:
-            self.logger.error(f"Erro ao salvar dados: {e}")
-            return False
+
+    def compact(self) -> bool:
+        """
+        Regrava o JSON completo do dicionário, com backup, e descarta o journal de alterações.
+
+        Retorna:
+        - bool: True se salvo com sucesso, False caso contrário.
+        """
+        self.logger.info(f"Compactando o journal do dicionário ({self._journal_size} operações).")
+        return self.save_data()
+
+    def close(self) -> None:
+        """
+        Incorpora ao JSON as alterações pendentes no journal, atualiza o CSV de exportação
+        e fecha as conexões HTTP.
+        Deve ser chamado ao encerrar o aplicativo.
+        """
+        self.flush()
+        if self._journal_size:
+            self.compact()
+        self.flush_csv()
+        self._http.close()
+
+    def _mark_batch_csv(self, language: str) -> None:
+        """Registra o idioma como alterado no bloco em lote, movendo-o para o fim da ordem de exportação."""
+        language = _norm_key(language)
+        self._batch_csv_languages.pop(language, None)
+        self._batch_csv_languages[language] = None
+
+    def _update_export_after_add(self, language: str, word: str) -> None:
+        """
+        Reflete uma palavra recém-adicionada no CSV de exportação.
+
+        Se o CSV já contém o idioma da palavra, apenas acrescenta a nova linha; caso contrário,
+        ou se a palavra foi removida e sua linha antiga ainda consta no arquivo, regera o arquivo
+        para esse idioma.
+
+        Parâmetros:
+        - language (str): Código do idioma.
+        - word (str): Palavra adicionada.
+        """
+        with self._io_lock:
+            if self._batch_depth:
+                self._mark_batch_csv(language)
+                return
+            if (
+                self._csv_language != language
+                or word in self._csv_removed
+                or not os.path.exists(self.export_csv_path)
+            ):
+                self.export_dictionary_to_csv(language, self.export_csv_path)
+                return
+            details = self.dictionary[language][word]
+            try:
+                with open(self.export_csv_path, 'a', newline='', encoding='utf-8') as csvfile:
+                    csv.writer(csvfile).writerow((
+                        word,
+                        details.get('definition', ''),
+                        details.get('part_of_speech', ''),
+                        details.get('example', '')
+                    ))
+            except Exception as e:
+                self.logger.error(f"Erro ao acrescentar '{word}' ao CSV de exportação: {e}. Regerando o arquivo.")
+                self.export_dictionary_to_csv(language, self.export_csv_path)
+
+    def _update_export_after_remove(self, language: str, word: str) -> None:
+        """
+        Registra uma remoção ainda não refletida no CSV de exportação.
+
+        O arquivo só é regerado quando as remoções pendentes atingem CSV_REBUILD_THRESHOLD
+        ou em flush_csv().
+
+        Parâmetros:
+        - language (str): Código do idioma da palavra removida.
+        - word (str): Palavra removida.
+        """
+        with self._io_lock:
+            if self._batch_depth:
+                self._mark_batch_csv(language)
+                return
+            if self._csv_language != language:
+                # O CSV contém outro idioma (ou é desconhecido); regera para o idioma alterado
+                self.export_dictionary_to_csv(language, self.export_csv_path)
+                return
+            self._csv_removed.add(word)
+            if len(self._csv_removed) >= self.CSV_REBUILD_THRESHOLD:
+                self.flush_csv()
+
+    def flush_csv(self) -> bool:
+        """
+        Regera o CSV de exportação se houver remoções ainda não refletidas nele.
+
+        Retorna:
+        - bool: True se não havia pendências ou se a exportação foi bem-sucedida, False caso contrário.
+        """
+        with self._io_lock:
+            if not self._csv_removed or self._csv_language is None:
+                return True
+            return self.export_dictionary_to_csv(self._csv_language, self.export_csv_path)
 
     def validate_json(self, file_path: str) -> bool:
         """
@@ -166,11 +572,10 @@ class DictionaryManager:
         - bool: True se o JSON for válido, False caso contrário.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                json.load(file)
+            storage.load_json(file_path)
             self.logger.info(f"Arquivo JSON '{file_path}' é válido.")
             return True
-        except json.JSONDecodeError as e:
+        except storage.JSONDecodeError as e:
             self.logger.error(f"Erro ao validar JSON '{file_path}': {e}")
             return False
         except Exception as e:
@@ -189,27 +594,10 @@ class DictionaryManager:
         - dict: Contendo 'definition', 'part_of_speech' e 'example' se bem-sucedido.
         - None: Se a busca falhar ou os dados não forem encontrados.
         """
-        api_url = f"https://api.dictionaryapi.dev/api/v2/entries/{language}/{word}"
         try:
-            response = requests.get(api_url, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    first_entry = data[0]
-                    meanings = first_entry.get('meanings', [])
-                    if meanings:
-                        first_meaning = meanings[0]
-                        part_of_speech = first_meaning.get('partOfSpeech', 'N/A')
-                        definitions = first_meaning.get('definitions', [])
-                        if definitions:
-                            first_definition = definitions[0]
-                            definition = first_definition.get('definition', 'Definição não disponível.')
-                            example = first_definition.get('example', 'Exemplo não disponível.')
-                            return {
-                                'definition': definition,
-                                'part_of_speech': part_of_speech,
-                                'example': example
-                            }
+            # Cópia para que o chamador não altere a resposta armazenada no cache
+            return dict(self._fetch_cached(word, language))
+        except _DefinitionNotFound:
             self.logger.warning(f"Definição não encontrada para a palavra '{word}' no idioma '{language}'.")
             return None
         except requests.RequestException as e:
@@ -219,6 +607,52 @@ class DictionaryManager:
             self.logger.error(f"Erro inesperado ao buscar definição para '{word}': {e}")
             return None
 
+    def _fetch_uncached(self, word: str, language: str) -> Dict[str, Any]:
+        """
+        Consulta a API de dicionário, sem cache.
+
+        Parâmetros:
+        - word (str): Palavra para buscar a definição.
+        - language (str): Código do idioma (ex: 'en', 'pt').
+
+        Retorna:
+        - dict: Contendo 'definition', 'part_of_speech' e 'example'.
+
+        Lança:
+        - _DefinitionNotFound: Se a API não retornar uma definição.
+        - requests.RequestException: Se a requisição falhar.
+        """
+        api_url = f"https://api.dictionaryapi.dev/api/v2/entries/{language}/{word}"
+        response = self._http.get(api_url, timeout=5)
+        if response.status_code == 200:
+            # Decodifica os bytes da resposta diretamente (orjson quando disponível), sem passar por str
+            extracted = _extract_first_definition(storage.loads(response.content))
+            if extracted is not None:
+                return extracted
+        raise _DefinitionNotFound(word)
+
+    def fetch_definitions_bulk(self, words: List[str], language: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Busca as definições de várias palavras na API em paralelo.
+
+        As requisições compartilham o pool de conexões da sessão HTTP; respostas já obtidas
+        vêm do cache sem acessar a rede.
+
+        Parâmetros:
+        - words (List[str]): Palavras a buscar.
+        - language (str): Código do idioma (ex: 'en', 'pt').
+
+        Retorna:
+        - dict: Para cada palavra, o resultado de fetch_definition_from_api (dict ou None).
+        """
+        unique_words = list(dict.fromkeys(words))
+        if not unique_words:
+            return {}
+        max_workers = min(self.HTTP_POOL_SIZE, len(unique_words))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda word: self.fetch_definition_from_api(word, language), unique_words)
+            return dict(zip(unique_words, results))
+
     def add_word(
         self,
         word: str,
@@ -240,13 +674,16 @@ class DictionaryManager:
         Retorna:
         - tuple: (bool, str) indicando sucesso e mensagem.
         """
-        word = word.lower().strip()
+        word = _norm_key(word)
         if not word:
             self.logger.warning("Tentativa de adicionar uma palavra vazia.")
             return False, "A palavra não pode estar vazia."
+        if not _WORD_RE.match(word):
+            self.logger.warning(f"Tentativa de adicionar uma palavra com caracteres inválidos: '{word}'.")
+            return False, "A palavra deve conter apenas letras, hífens, apóstrofos ou espaços."
 
         if language not in self.dictionary:
-            self.dictionary[language] = {}
+            self.dictionary[sys.intern(language)] = {}
             self.logger.info(f"Idioma '{language}' adicionado ao dicionário.")
     
         if word in self.dictionary[language]:
@@ -265,19 +702,36 @@ class DictionaryManager:
                 return False, "Definição e exemplo não encontrados na API. Por favor, forneça manualmente."
 
         # Adiciona a palavra ao dicionário
-        self.dictionary[language][word] = {
+        entry = {
             'definition': definition.strip(),
-            'part_of_speech': part_of_speech.strip(),
+            'part_of_speech': sys.intern(part_of_speech.strip()),
             'example': example.strip() if example and isinstance(example, str) else ""
         }
+        self.store_entry(language, word, entry)
         self.logger.info(f"Palavra '{word}' adicionada ao idioma '{language}' com sucesso.")
-        self.save_data()
-        
-        # Atualizar o arquivo de exportação
-        self.export_dictionary_to_csv(language, self.export_csv_path)
         self.logger.info(f"Arquivo de exportação '{self.export_csv_path}' atualizado após adicionar '{word}'.")
         return True, "Palavra adicionada com sucesso."
 
+    def store_entry(self, language: str, word: str, entry: Dict[str, Any]) -> None:
+        """
+        Grava no dicionário uma entrada já validada e normalizada, atualizando a lista ordenada,
+        os caches, o journal e o arquivo de exportação.
+
+        Parâmetros:
+        - language (str): Código do idioma.
+        - word (str): Palavra já normalizada.
+        - entry (Dict[str, Any]): Entrada com 'definition', 'part_of_speech' e 'example'.
+        """
+        language_dict = self.dictionary.get(language)
+        if language_dict is None:
+            language_dict = self.dictionary[sys.intern(language)] = {}
+        language_dict[word] = entry
+        self._index_add(language, word)
+        self._invalidate_words(language, (word,))
+        self._record_change({'op': 'add', 'lang': language, 'word': word, 'entry': entry})
+        # Atualizar o arquivo de exportação
+        self._update_export_after_add(language, word)
+
     def manual_add_word(
         self,
         word: str,
@@ -299,13 +753,16 @@ class DictionaryManager:
         Retorna:
         - tuple: (bool, str) indicando sucesso e mensagem.
         """
-        word = word.lower().strip()
+        word = _norm_key(word)
         if not word:
             self.logger.warning("Tentativa de adicionar uma palavra vazia manualmente.")
             return False, "A palavra não pode estar vazia."
+        if not _WORD_RE.match(word):
+            self.logger.warning(f"Tentativa de adicionar manualmente uma palavra com caracteres inválidos: '{word}'.")
+            return False, "A palavra deve conter apenas letras, hífens, apóstrofos ou espaços."
 
         if language not in self.dictionary:
-            self.dictionary[language] = {}
+            self.dictionary[sys.intern(language)] = {}
             self.logger.info(f"Idioma '{language}' adicionado ao dicionário.")
 
         if word in self.dictionary[language]:
@@ -317,20 +774,18 @@ class DictionaryManager:
             return False, "Definição, classe gramatical e exemplo são obrigatórios."
 
         # Adiciona a palavra ao dicionário
-        self.dictionary[language][word] = {
-            'definition': definition.strip(),
-            'part_of_speech': part_of_speech.strip(),
-            'example': example.strip()
+        word, definition, part_of_speech, example = _normalize_row(word, definition, part_of_speech, example)
+        entry = {
+            'definition': definition,
+            'part_of_speech': sys.intern(part_of_speech),
+            'example': example
         }
+        self.store_entry(language, word, entry)
         self.logger.info(f"Palavra '{word}' adicionada manualmente ao idioma '{language}' com sucesso.")
-        self.save_data()
-        
-        # Atualizar o arquivo de exportação
-        self.export_dictionary_to_csv(language, self.export_csv_path)
         self.logger.info(f"Arquivo de exportação '{self.export_csv_path}' atualizado após adicionar '{word}' manualmente.")
         return True, "Palavra adicionada com sucesso."
 
-    def get_definition(self, word: str, language: str) -> Optional[Dict[str, Any]]:
+    def get_definition(self, word: str, language: str) -> Optional[Mapping[str, Any]]:
         """
         Obtém a definição de uma palavra para um idioma específico.
         
@@ -339,16 +794,32 @@ class DictionaryManager:
         - language (str): Código do idioma.
         
         Retorna:
-        - dict: Contendo 'definition', 'part_of_speech', 'example' se a palavra existir.
+        - Mapping: Somente leitura, contendo 'definition', 'part_of_speech', 'example' se a palavra existir.
         - None: Se a palavra não existir no dicionário.
         """
-        word = word.lower().strip()
+        word = _norm_key(word)
+        key = (language, word)
+        try:
+            return self._defn_cache[key]
+        except KeyError:
+            pass
+
         if language in self.dictionary and word in self.dictionary[language]:
             self.logger.info(f"Definição encontrada para a palavra '{word}' no idioma '{language}'.")
-            return self.dictionary[language][word]
+            # Visão somente leitura: a resposta guardada não pode ser alterada por quem a recebe
+            result = MappingProxyType(self.dictionary[language][word])
         else:
             self.logger.info(f"A palavra '{word}' não foi encontrada no idioma '{language}'.")
-            return None
+            result = None
+
+        if len(self._defn_cache) >= self.DEFINITION_CACHE_SIZE:
+            try:
+                # Descarta a consulta mais antiga
+                del self._defn_cache[next(iter(self._defn_cache))]
+            except (StopIteration, KeyError):
+                pass
+        self._defn_cache[key] = result
+        return result
 
     def set_language(self, language: str) -> bool:
         """
@@ -360,7 +831,7 @@ class DictionaryManager:
         Retorna:
         - bool: True se o idioma foi alterado com sucesso, False caso contrário.
         """
-        language = language.lower().strip()
+        language = _norm_key(language)
         if language in self.language_data:
             self.logger.info(f"Idioma atual definido para '{language}'.")
             return True
@@ -379,15 +850,17 @@ class DictionaryManager:
         Retorna:
         - tuple: (bool, str) indicando sucesso e mensagem.
         """
-        word = word.lower().strip()
+        word = _norm_key(word)
         if language in self.dictionary and word in self.dictionary[language]:
             del self.dictionary[language][word]
-            self.save_data()
+            self._index_remove(language, word)
+            self._invalidate_words(language, (word,))
+            self._record_change({'op': 'remove', 'lang': language, 'word': word})
             self.logger.info(f"Palavra '{word}' removida do idioma '{language}'.")
             
-            # Atualizar o arquivo de exportação
-            self.export_dictionary_to_csv(language, self.export_csv_path)
-            self.logger.info(f"Arquivo de exportação '{self.export_csv_path}' atualizado após remover '{word}'.")
+            # Marcar o arquivo de exportação para ser regerado (ver flush_csv)
+            self._update_export_after_remove(language, word)
+            self.logger.info(f"Remoção de '{word}' registrada para o arquivo de exportação '{self.export_csv_path}'.")
             return True, "Palavra removida com sucesso."
         else:
             self.logger.warning(f"Tentativa de remover palavra inexistente '{word}' no idioma '{language}'.")
@@ -395,7 +868,8 @@ class DictionaryManager:
 
     def list_words(self, language: str) -> Optional[list]:
         """
-        Lista todas as palavras disponíveis em um idioma específico.
+        Lista todas as palavras disponíveis em um idioma específico, em ordem alfabética.
+        A ordenação é feita uma única vez por idioma e mantida nas alterações seguintes.
         
         Parâmetros:
         - language (str): Código do idioma.
@@ -404,19 +878,47 @@ class DictionaryManager:
         - list: Lista de palavras.
         - None: Se o idioma não existir.
         """
-        language = language.lower().strip()
+        language = _norm_key(language)
         if language in self.dictionary:
-            words = sorted(list(self.dictionary[language].keys()))
+            # Cópia para que o chamador não altere a lista mantida internamente
+            words = list(self._sorted(language))
             self.logger.info(f"Listando {len(words)} palavras no idioma '{language}'.")
             return words
         else:
             self.logger.warning(f"Tentativa de listar palavras para idioma inexistente '{language}'.")
             return None
 
+    def prefix_search(self, prefix: str, language: str, k: int = 10) -> List[str]:
+        """
+        Sugere até k palavras do idioma que começam com o prefixo, em ordem alfabética.
+        Usa busca binária na lista ordenada já mantida por list_words, sem estrutura adicional.
+        
+        Parâmetros:
+        - prefix (str): Prefixo digitado.
+        - language (str): Código do idioma.
+        - k (int): Quantidade máxima de sugestões.
+        
+        Retorna:
+        - list: Palavras encontradas (vazia se o idioma não existir).
+        """
+        language = _norm_key(language)
+        prefix = _norm_key(prefix)
+        if not prefix or k <= 0 or language not in self.dictionary:
+            return []
+        words = self._sorted(language)
+        start = bisect.bisect_left(words, prefix)
+        results = []
+        for word in words[start:start + k]:
+            if not word.startswith(prefix):
+                break
+            results.append(word)
+        return results
+
     def export_dictionary_to_csv(self, language: str, csv_path: Optional[str] = None) -> bool:
         """
         Exporta o dicionário para um arquivo CSV.
-        Atualiza o arquivo de exportação sempre que uma palavra é adicionada ou removida.
+        Usado também para regerar o arquivo de exportação: adições são acrescentadas a ele diretamente,
+        mas remoções só são refletidas quando ele é regerado (ver flush_csv).
         
         Parâmetros:
         - language (str): Código do idioma.
@@ -428,30 +930,105 @@ class DictionaryManager:
         if not csv_path:
             csv_path = self.export_csv_path
 
-        language = language.lower().strip()
+        language = _norm_key(language)
         if language not in self.dictionary:
             self.logger.warning(f"Idioma '{language}' não encontrado. Exportação abortada.")
             return False
 
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['word', 'definition', 'part_of_speech', 'example']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for word, details in self.dictionary[language].items():
-                    writer.writerow({
-                        'word': word,
-                        'definition': details.get('definition', ''),
-                        'part_of_speech': details.get('part_of_speech', ''),
-                        'example': details.get('example', '')
-                    })
+            with self._io_lock:
+                with open(csv_path, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_SIZE) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(self.CSV_FIELDNAMES)
+                    # Tuplas geradas sob demanda: sem um dict por linha nem a lista completa em memória
+                    writer.writerows(
+                        (word, details.get('definition', ''), details.get('part_of_speech', ''), details.get('example', ''))
+                        for word, details in self.dictionary[language].items()
+                    )
+                if csv_path == self.export_csv_path:
+                    # O arquivo de exportação passa a refletir exatamente este idioma
+                    self._csv_language = language
+                    self._csv_removed.clear()
             self.logger.info(f"Dicionário exportado com sucesso para '{csv_path}'.")
             return True
         except Exception as e:
             self.logger.error(f"Erro ao exportar dicionário para CSV: {e}")
             return False
 
-    def import_dictionary_from_csv(self, csv_path: str, language: str) -> Tuple[bool, str]:
+    def import_rows(self, rows: Iterable[Sequence[str]], language: str) -> Tuple[int, int]:
+        """
+        Insere no dicionário, em fluxo, registros (palavra, definição, classe gramatical, exemplo).
+
+        Os registros são consumidos um a um, sem materializar a entrada inteira. Registros incompletos
+        e palavras já existentes são ignorados. As novas entradas só são incorporadas ao dicionário
+        depois que todos os registros foram lidos: se a leitura falhar no meio (por exemplo, com um
+        UnicodeDecodeError), a exceção é propagada e o dicionário permanece inalterado.
+        Ao final, o dicionário é salvo e o CSV de exportação regerado; chamadas sucessivas dentro
+        de um bloco `with` gravam uma única vez, ao fim do bloco.
+
+        Parâmetros:
+        - rows (Iterable[Sequence[str]]): Registros com palavra, definição, classe gramatical e exemplo.
+        - language (str): Código do idioma.
+
+        Retorna:
+        - tuple: (palavras adicionadas, registros ignorados).
+        """
+        language_key = sys.intern(language.lower())
+        language_dict = self.dictionary.get(language_key, {})
+        # Entradas novas, incorporadas ao dicionário apenas se todos os registros forem lidos
+        staged: Dict[str, Dict[str, Any]] = {}
+        logger = self.logger
+        count_skipped = 0
+        for row in rows:
+            word, definition, part_of_speech, example = _normalize_row(*row)
+
+            if not word or not definition or not part_of_speech:
+                logger.warning("Entrada incompleta no CSV: %s. Ignorando.", row)
+                count_skipped += 1
+                continue
+
+            if word not in language_dict and word not in staged:
+                staged[word] = {
+                    'definition': definition,
+                    'part_of_speech': sys.intern(part_of_speech),
+                    'example': example
+                }
+                logger.debug("Palavra '%s' adicionada ao dicionário.", word)
+            else:
+                # Opção: Atualizar definição existente ou ignorar
+                # Aqui, optamos por ignorar duplicatas
+                count_skipped += 1
+                logger.info("Palavra '%s' já existe no idioma '%s'. Ignorada durante a importação.", word, language)
+
+        self.dictionary.setdefault(language_key, {}).update(staged)
+        count_added = len(staged)
+        # A importação pode inserir muitas palavras; a lista ordenada é reconstruída na próxima consulta
+        self._sorted_words.pop(language_key, None)
+        self._invalidate_words(language_key, staged)
+        # Salva e atualiza o arquivo de exportação uma única vez; dentro de um bloco em lote, ao fim do bloco
+        with self:
+            self._dirty = True
+            self._mark_batch_csv(language)
+        return count_added, count_skipped
+
+    def import_arrow_batches(self, batches: Iterable[Dict[str, List[Optional[str]]]], language: str) -> Tuple[int, int]:
+        """
+        Importa lotes de colunas lidos pelo PyArrow (resultados de RecordBatch.to_pydict()).
+
+        Os registros de todos os lotes alimentam uma única chamada a import_rows: se a leitura de
+        qualquer lote falhar, nenhum registro é incorporado ao dicionário.
+
+        Parâmetros:
+        - batches (Iterable[dict]): Lotes com as colunas 'word', 'definition', 'part_of_speech' e,
+          opcionalmente, 'example'.
+        - language (str): Código do idioma.
+
+        Retorna:
+        - tuple: (palavras adicionadas, registros ignorados).
+        """
+        return self.import_rows(_arrow_rows(batches), language)
+
+    def import_dictionary_from_csv(self, csv_path: str, language: str, encoding: str = 'utf-8') -> Tuple[bool, str]:
         """
         Importa palavras de um arquivo CSV para o dicionário.
         Evita adicionar duplicatas e pode atualizar definições existentes conforme necessário.
@@ -459,6 +1036,7 @@ class DictionaryManager:
         Parâmetros:
         - csv_path (str): Caminho para o arquivo CSV de entrada.
         - language (str): Código do idioma.
+        - encoding (str): Codificação do arquivo CSV.
         
         Retorna:
         - tuple: (bool, str) indicando sucesso e mensagem.
@@ -468,40 +1046,34 @@ class DictionaryManager:
             return False, "Arquivo CSV não encontrado."
         
         try:
-            with open(csv_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                count_added = 0
-                count_skipped = 0
-                for row in reader:
-                    word = row.get('word', '').lower().strip()
-                    definition = row.get('definition', '').strip()
-                    part_of_speech = row.get('part_of_speech', '').strip()
-                    example = row.get('example', '').strip()
-                    
-                    if not word or not definition or not part_of_speech:
-                        self.logger.warning(f"Entrada incompleta no CSV: {row}. Ignorando.")
-                        count_skipped += 1
-                        continue
-                    
-                    language_dict = self.dictionary.setdefault(language.lower(), {})
-                    if word not in language_dict:
-                        language_dict[word] = {
-                            'definition': definition,
-                            'part_of_speech': part_of_speech,
-                            'example': example
-                        }
-                        count_added += 1
-                        self.logger.debug(f"Palavra '{word}' adicionada ao dicionário.")
-                    else:
-                        # Opção: Atualizar definição existente ou ignorar
-                        # Aqui, optamos por ignorar duplicatas
-                        count_skipped += 1
-                        self.logger.info(f"Palavra '{word}' já existe no idioma '{language}'. Ignorada durante a importação.")
-            self.save_data()
+            with open(csv_path, 'r', buffering=self.CSV_BUFFER_SIZE, newline='', encoding=encoding) as csvfile:
+                reader = csv.reader(csvfile)
+                header = [name.strip() for name in next(reader, [])]
+                missing = [name for name in ('word', 'definition', 'part_of_speech') if name not in header]
+                if missing:
+                    raise ValueError(f"Colunas obrigatórias ausentes no CSV: {', '.join(missing)}.")
+
+                # Lê as linhas como listas, acessando as colunas por posição em vez de criar um dict por linha
+                word_index = header.index('word')
+                definition_index = header.index('definition')
+                part_of_speech_index = header.index('part_of_speech')
+                example_index = header.index('example') if 'example' in header else None
+                width = len(header)
+
+                def fields():
+                    # Uma tupla por linha, completando com vazios as linhas mais curtas que o cabeçalho
+                    for row in reader:
+                        if len(row) < width:
+                            row = row + [''] * (width - len(row))
+                        yield (
+                            row[word_index],
+                            row[definition_index],
+                            row[part_of_speech_index],
+                            row[example_index] if example_index is not None else ''
+                        )
+
+                count_added, count_skipped = self.import_rows(fields(), language)
             self.logger.info(f"Dicionário importado com sucesso a partir de '{csv_path}'. {count_added} palavras adicionadas, {count_skipped} palavras ignoradas.")
-            # Atualizar o arquivo de exportação após importação
-            self.export_dictionary_to_csv(language, self.export_csv_path)
-            self.logger.info(f"Arquivo de exportação '{self.export_csv_path}' atualizado após importação.")
             return True, f"Dicionário importado com sucesso. {count_added} palavras adicionadas, {count_skipped} palavras ignoradas."
         except Exception as e:
             self.logger.error(f"Erro ao importar dicionário a partir de CSV: {e}")
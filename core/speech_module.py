@@ -2,40 +2,93 @@
 
 import speech_recognition as sr
 from gtts import gTTS
+import hashlib
+import io
 import os
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from playsound import playsound
 import logging
 
 class SpeechModule:
     """Módulo de reconhecimento de fala e síntese de voz."""
 
-    def __init__(self, language='en'):
+    # Código de idioma do reconhecedor do Google para cada idioma do aplicativo
+    _GOOGLE_LANG = {'pt': 'pt-BR', 'es': 'es-ES', 'fr': 'fr-FR', 'en': 'en-US'}
+
+    # Número máximo de áudios sintetizados mantidos no cache em disco
+    TTS_CACHE_MAX_FILES = 512
+
+    # Duração, em segundos, da calibração do ruído ambiente feita na primeira escuta
+    CALIBRATION_SECONDS = 0.5
+
+    # Texto curto sintetizado (e descartado) no pré-aquecimento da síntese de voz
+    TTS_PREWARM_TEXT = "OK."
+
+    def __init__(self, language='en', tts_cache_dir='data/tts_cache'):
         self.language = language
         self.recognizer = sr.Recognizer()
+        # Microfone criado uma única vez e reaproveitado; o lock impede dois usos simultâneos
+        self.microphone = None
+        self._microphone_lock = threading.Lock()
+        # O ruído ambiente é calibrado uma única vez, na primeira escuta
+        self._calibrated = False
+        # Sinal de interrupção da fala em partes mais recente (speak_stream)
+        self._stop_event = threading.Event()
+        self._stop_lock = threading.Lock()
+        # Thread única, mantida enquanto o módulo existir, que sintetiza o próximo trecho durante a reprodução
+        self._tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts')
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Áudios já sintetizados, reaproveitados quando o mesmo texto é falado novamente
+        self.tts_cache_dir = tts_cache_dir
 
     def set_language(self, language):
         """Define o idioma para reconhecimento de fala e síntese de voz."""
         self.language = language
         self.logger.info(f"Idioma de voz definido para {language}.")
 
+    def _get_microphone(self):
+        """Retorna o microfone compartilhado, criando-o no primeiro uso."""
+        if self.microphone is None:
+            self.microphone = sr.Microphone()
+        return self.microphone
+
+    def prewarm(self):
+        """
+        Adianta, em segundo plano, inicializações que ficariam na primeira consulta por voz.
+
+        Cria o objeto do microfone, o que carrega o PyAudio e consulta os dispositivos de áudio, sem
+        abrir o fluxo de captura, gravar áudio nem ocupar o lock do microfone. Também sintetiza um texto
+        curto com o gTTS, descartando o áudio, para que a primeira resposta não pague a validação do
+        idioma e o primeiro acesso ao serviço. A reprodução (playsound) não é pré-aquecida, pois
+        emitiria som. A calibração do ruído ambiente fica para o primeiro recognize_speech.
+        Falhas (por exemplo, sem microfone ou sem rede) são apenas registradas.
+        """
+        try:
+            self._get_microphone()
+            self.logger.info("Microfone inicializado.")
+        except Exception as e:
+            self.logger.warning(f"Não foi possível pré-aquecer o microfone: {e}")
+        try:
+            gTTS(text=self.TTS_PREWARM_TEXT, lang=self.language).write_to_fp(io.BytesIO())
+            self.logger.info("Síntese de voz inicializada.")
+        except Exception as e:
+            self.logger.warning(f"Não foi possível pré-aquecer a síntese de voz: {e}")
+
     def recognize_speech(self):
         """Captura e converte a fala do usuário em texto."""
-        with sr.Microphone() as source:
+        with self._microphone_lock, self._get_microphone() as source:
+            if not self._calibrated:
+                # Primeira escuta: ajusta o limiar de energia ao ruído ambiente
+                self.recognizer.adjust_for_ambient_noise(source, duration=self.CALIBRATION_SECONDS)
+                self._calibrated = True
             self.logger.info("Aguardando fala do usuário...")
             print("Por favor, fale agora...")
             audio = self.recognizer.listen(source)
 
         try:
-            if self.language == 'pt':
-                text = self.recognizer.recognize_google(audio, language='pt-BR')
-            elif self.language == 'es':
-                text = self.recognizer.recognize_google(audio, language='es-ES')
-            elif self.language == 'fr':
-                text = self.recognizer.recognize_google(audio, language='fr-FR')
-            else:
-                text = self.recognizer.recognize_google(audio, language='en-US')
+            google_language = self._GOOGLE_LANG.get(self.language, 'en-US')
+            text = self.recognizer.recognize_google(audio, language=google_language)
             self.logger.info(f"Fala reconhecida: {text}")
             print(f"Você disse: {text}")
             return text
@@ -49,12 +102,90 @@ class SpeechModule:
             return None
 
     def speak(self, text):
-        """Converte texto em fala e reproduz o áudio."""
+        """
+        Converte texto em fala e reproduz o áudio.
+
+        O áudio de cada par (idioma, texto) é sintetizado uma única vez e guardado em
+        tts_cache_dir; repetições são reproduzidas do disco, sem acessar a rede.
+        """
+        try:
+            playsound(self._synthesize(text))
+            self.logger.info("Áudio reproduzido com sucesso.")
+        except Exception as e:
+            self.logger.error(f"Erro ao gerar ou reproduzir o áudio: {e}")
+
+    def speak_stream(self, texts):
+        """
+        Fala uma sequência de trechos (por exemplo, frases), um após o outro.
+
+        Enquanto um trecho é reproduzido, o seguinte já é sintetizado em segundo plano; assim o
+        primeiro áudio começa após a síntese apenas do primeiro trecho, não da resposta inteira.
+        stop(), ou uma nova chamada a speak_stream, interrompe a sequência antes do próximo trecho.
+
+        Parâmetros:
+        - texts (iterable): Trechos de texto a serem falados, em ordem.
+        """
+        # Cada sequência tem o próprio sinal: uma nova fala interrompe a anterior sem rearmar o sinal dela
+        stop_event = threading.Event()
+        with self._stop_lock:
+            self._stop_event.set()
+            self._stop_event = stop_event
         try:
-            tts = gTTS(text=text, lang=self.language)
-            with tempfile.NamedTemporaryFile(delete=True, suffix='.mp3') as fp:
-                tts.save(fp.name)
-                playsound(fp.name)
+            pending = None
+            for text in texts:
+                if stop_event.is_set():
+                    break
+                following = self._tts_executor.submit(self._synthesize, text)
+                if pending is not None:
+                    playsound(pending.result())
+                pending = following
+            if pending is not None and not stop_event.is_set():
+                playsound(pending.result())
             self.logger.info("Áudio reproduzido com sucesso.")
         except Exception as e:
             self.logger.error(f"Erro ao gerar ou reproduzir o áudio: {e}")
+
+    def stop(self):
+        """Interrompe uma fala em partes em andamento; o trecho já em reprodução termina normalmente."""
+        with self._stop_lock:
+            self._stop_event.set()
+
+    def _synthesize(self, text):
+        """
+        Retorna o caminho do áudio do texto no idioma atual, sintetizando-o se ainda não estiver em cache.
+
+        Parâmetros:
+        - text (str): Texto a ser sintetizado.
+
+        Retorna:
+        - str: Caminho do arquivo mp3.
+        """
+        audio_path = self._cached_audio_path(text)
+        if os.path.exists(audio_path):
+            # Atualiza a data de modificação, usada para descartar os áudios menos recentes
+            os.utime(audio_path)
+        else:
+            os.makedirs(self.tts_cache_dir, exist_ok=True)
+            tmp_path = audio_path + '.tmp'
+            gTTS(text=text, lang=self.language).save(tmp_path)
+            os.replace(tmp_path, audio_path)
+            self._prune_tts_cache()
+        return audio_path
+
+    def _cached_audio_path(self, text):
+        """Retorna o caminho do áudio em cache para o texto no idioma atual."""
+        key = hashlib.blake2b(f"{self.language}|{text}".encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.tts_cache_dir, f"{key}.mp3")
+
+    def _prune_tts_cache(self):
+        """Remove os áudios usados há mais tempo quando o cache excede TTS_CACHE_MAX_FILES."""
+        try:
+            entries = [entry for entry in os.scandir(self.tts_cache_dir) if entry.name.endswith('.mp3')]
+            excess = len(entries) - self.TTS_CACHE_MAX_FILES
+            if excess <= 0:
+                return
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:excess]:
+                os.remove(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Erro ao limpar o cache de áudio: {e}")
@@ -0,0 +1,356 @@
+# core/storage.py
+
+import glob
+import json
+import mmap
+import os
+import pickle
+import re
+import shutil
+import struct
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele usamos o módulo json da biblioteca padrão
+    orjson = None
+
+# Sufixo do snapshot binário gravado ao lado de cada arquivo JSON
+SNAPSHOT_SUFFIX = '.pkl'
+
+# Cabeçalho do snapshot: identificador do formato seguido de (mtime_ns, tamanho) do JSON de origem,
+# lido e comparado antes de desserializar o restante do arquivo
+_SNAPSHOT_MAGIC = b'ADS2'
+_SNAPSHOT_HEADER = struct.Struct('<4sqq')
+
+# Sufixo do journal de alterações (uma operação JSON por linha) gravado ao lado de cada arquivo JSON
+JOURNAL_SUFFIX = '.wal'
+
+# Indentação dos arquivos JSON gravados, a mesma dos arquivos em data/
+JSON_INDENT = 4
+# Indentação no início de cada linha da saída do orjson
+_INDENT_RE = re.compile(rb'^((?:  )+)', re.MULTILINE)
+
+# orjson.JSONDecodeError é subclasse de json.JSONDecodeError, então um único tipo cobre ambos
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data: Any) -> Any:
+    """
+    Decodifica JSON a partir de bytes (ou qualquer objeto compatível com o protocolo de buffer).
+
+    Parâmetros:
+    - data: Conteúdo JSON codificado em UTF-8.
+
+    Retorna:
+    - Any: Objeto Python decodificado.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializa um objeto para JSON indentado em UTF-8.
+
+    Parâmetros:
+    - obj (Any): Objeto a ser serializado.
+
+    Retorna:
+    - bytes: Conteúdo JSON pronto para ser gravado.
+    """
+    if orjson is not None:
+        # O orjson só indenta com 2 espaços; dobrar a indentação de cada linha reproduz o layout de 4 espaços
+        # do json da biblioteca padrão (strings JSON não contêm quebras de linha literais)
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return _INDENT_RE.sub(rb'\1\1', data)
+    return json.dumps(obj, ensure_ascii=False, indent=JSON_INDENT).encode('utf-8')
+
+def load_json(path: str) -> Any:
+    """
+    Carrega um arquivo JSON mapeando-o em memória, sem cópia intermediária para o espaço do usuário.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo JSON.
+
+    Retorna:
+    - Any: Objeto Python decodificado.
+    """
+    with open(path, 'rb') as file:
+        if orjson is None or os.fstat(file.fileno()).st_size == 0:
+            # mmap não aceita arquivos vazios; o decodificador reporta o erro normalmente
+            return loads(file.read())
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+def dump_json(obj: Any, path: str) -> None:
+    """
+    Grava um objeto como JSON em uma única escrita, de forma atômica.
+
+    O conteúdo é escrito em um arquivo temporário que substitui o destino com os.replace;
+    assim o arquivo anterior nunca fica truncado e hardlinks para ele (backups) permanecem intactos.
+
+    Parâmetros:
+    - obj (Any): Objeto a ser serializado.
+    - path (str): Caminho do arquivo de destino.
+    """
+    data = dumps(obj)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def create_json(obj: Any, path: str) -> bool:
+    """
+    Cria um arquivo JSON apenas se ele ainda não existir.
+
+    A criação usa O_EXCL: a verificação de existência e a criação são uma única chamada de sistema.
+    O diretório do arquivo é criado se necessário.
+
+    Parâmetros:
+    - obj (Any): Conteúdo inicial do arquivo.
+    - path (str): Caminho do arquivo.
+
+    Retorna:
+    - bool: True se o arquivo foi criado, False se já existia.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    except FileExistsError:
+        return False
+    with open(fd, 'wb') as file:
+        file.write(dumps(obj))
+    return True
+
+def backup_file(path: str, backup_path: str) -> None:
+    """
+    Cria uma cópia de segurança de um arquivo.
+
+    Usa um hardlink, que não copia nenhum byte; como dump_json substitui o arquivo em vez de
+    reescrevê-lo, o backup continua apontando para o conteúdo antigo. Se o sistema de arquivos
+    não suportar hardlinks, copia o arquivo.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo original.
+    - backup_path (str): Caminho da cópia de segurança.
+    """
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy(path, backup_path)
+
+# Número mínimo de dígitos de time.time_ns() (qualquer instante a partir de 2001), que distingue
+# os backups criados pelo aplicativo dos antigos, com sufixo AAAAMMDDHHMMSS
+_TIME_NS_MIN_DIGITS = 19
+
+def prune_backups(path: str, keep: int) -> List[str]:
+    """
+    Mantém apenas os `keep` backups mais recentes de um arquivo.
+
+    Só são considerados os backups criados pelo aplicativo, `<path>.backup.<time.time_ns()>`; quanto maior
+    o número, mais recente o backup. Outros arquivos, como os backups antigos com sufixo de data e hora
+    (AAAAMMDDHHMMSS) versionados no repositório ou sufixos não numéricos, são mantidos.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo original.
+    - keep (int): Quantidade de backups a manter.
+
+    Retorna:
+    - List[str]: Caminhos dos backups removidos.
+    """
+    prefix = path + '.backup.'
+    backups = []
+    for backup_path in glob.glob(glob.escape(prefix) + '*'):
+        suffix = backup_path[len(prefix):]
+        if suffix.isdigit() and len(suffix) >= _TIME_NS_MIN_DIGITS:
+            backups.append((int(suffix), backup_path))
+    backups.sort()
+
+    removed = []
+    for _, backup_path in backups[:max(len(backups) - keep, 0)]:
+        try:
+            os.remove(backup_path)
+            removed.append(backup_path)
+        except FileNotFoundError:
+            pass
+    return removed
+
+def _json_signature(path: str) -> tuple:
+    """Retorna (mtime_ns, tamanho) do arquivo JSON, usados para validar o snapshot."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def load_snapshot(path: str) -> Optional[Any]:
+    """
+    Carrega o snapshot binário de um arquivo JSON, se ainda corresponder ao JSON atual.
+
+    O snapshot é mapeado em memória; o cabeçalho é comparado com o JSON atual e só então
+    o conteúdo é desserializado diretamente do mapeamento.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo JSON de origem.
+
+    Retorna:
+    - Any: Objeto armazenado no snapshot.
+    - None: Se o snapshot não existir, estiver corrompido ou desatualizado em relação ao JSON.
+    """
+    try:
+        signature = _json_signature(path)
+        with open(path + SNAPSHOT_SUFFIX, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, mtime_ns, size = _SNAPSHOT_HEADER.unpack_from(mapped)
+                if magic != _SNAPSHOT_MAGIC or (mtime_ns, size) != signature:
+                    # Snapshot de outro formato ou desatualizado: o conteúdo nem chega a ser desserializado
+                    return None
+                with memoryview(mapped)[_SNAPSHOT_HEADER.size:] as body:
+                    return pickle.loads(body)
+    except Exception:
+        return None
+
+def write_snapshot(obj: Any, path: str) -> None:
+    """
+    Grava o snapshot binário de um objeto recém-salvo no arquivo JSON `path`.
+
+    Assim como em dump_json, o snapshot é gravado em um arquivo temporário que substitui o anterior,
+    de modo que um processo lendo o snapshot nunca encontra um arquivo pela metade.
+
+    Parâmetros:
+    - obj (Any): Objeto salvo no JSON.
+    - path (str): Caminho do arquivo JSON de origem.
+    """
+    header = _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, *_json_signature(path))
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    snapshot_path = path + SNAPSHOT_SUFFIX
+    tmp_path = snapshot_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(header)
+            file.write(data)
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def append_journal(record: Dict[str, Any], path: str) -> None:
+    """
+    Acrescenta uma operação ao journal do arquivo JSON `path`, em uma única linha.
+
+    O custo da escrita é proporcional ao tamanho da operação, não ao do arquivo JSON.
+
+    Parâmetros:
+    - record (Dict[str, Any]): Operação a registrar.
+    - path (str): Caminho do arquivo JSON de origem.
+    """
+    if orjson is not None:
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+    with open(path + JOURNAL_SUFFIX, 'ab') as file:
+        file.write(line)
+
+def read_journal(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Percorre as operações registradas no journal do arquivo JSON `path`, na ordem em que foram gravadas.
+
+    Uma última linha incompleta (escrita interrompida) é ignorada, assim como qualquer linha
+    que não possa ser decodificada; as operações seguintes continuam sendo lidas.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo JSON de origem.
+
+    Retorna:
+    - Iterator[Dict[str, Any]]: Operações registradas; vazio se não houver journal.
+    """
+    try:
+        file = open(path + JOURNAL_SUFFIX, 'rb')
+    except FileNotFoundError:
+        return
+    with file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = loads(line)
+            except (JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(record, dict):
+                yield record
+
+def repair_journal(path: str) -> bool:
+    """
+    Descarta uma última linha incompleta do journal, deixada por uma escrita interrompida.
+
+    Sem o reparo, a próxima operação acrescentada seria gravada na mesma linha do fragmento
+    e se perderia junto com ele.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo JSON de origem.
+
+    Retorna:
+    - bool: True se o journal foi truncado, False se já estava íntegro ou não existe.
+    """
+    try:
+        file = open(path + JOURNAL_SUFFIX, 'r+b')
+    except FileNotFoundError:
+        return False
+    with file:
+        data = file.read()
+        if not data or data.endswith(b'\n'):
+            return False
+        file.truncate(data.rfind(b'\n') + 1)
+        return True
+
+def replay_journal(dictionary: Dict[str, Dict[str, Any]], path: str) -> int:
+    """
+    Aplica a um dicionário carregado as operações registradas no journal do arquivo JSON `path`.
+
+    Antes da leitura, uma última linha incompleta é removida do journal com repair_journal;
+    operações ilegíveis ou sem os campos esperados são ignoradas.
+
+    Parâmetros:
+    - dictionary (Dict[str, Dict[str, Any]]): Dicionário por idioma, alterado no próprio objeto.
+    - path (str): Caminho do arquivo JSON de origem.
+
+    Retorna:
+    - int: Número de operações aplicadas.
+    """
+    repair_journal(path)
+    applied = 0
+    for record in read_journal(path):
+        op = record.get('op')
+        language = record.get('lang')
+        word = record.get('word')
+        if not isinstance(language, str) or not isinstance(word, str):
+            continue
+        if op == 'add' and isinstance(record.get('entry'), dict):
+            dictionary.setdefault(language, {})[word] = record['entry']
+        elif op == 'remove':
+            dictionary.get(language, {}).pop(word, None)
+        else:
+            continue
+        applied += 1
+    return applied
+
+def truncate_journal(path: str) -> None:
+    """
+    Remove o journal do arquivo JSON `path`, depois que suas operações foram gravadas no JSON.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo JSON de origem.
+    """
+    try:
+        os.remove(path + JOURNAL_SUFFIX)
+    except FileNotFoundError:
+        pass
@@ -1,11 +1,22 @@
 # core/task_manager.py
 
 import logging
-from typing import Tuple
+import sys
+import threading
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from .definition_module import DefinitionModule
 from .confidence_module import ConfidenceModule
 from .speech_module import SpeechModule
-from .dictionary_manager import DictionaryManager
+from .dictionary_manager import DictionaryManager, _norm_key
+
+# Campos de uma entrada do dicionário e os textos usados quando algum deles está ausente
+_ENTRY_FIELDS = ('definition', 'part_of_speech', 'example')
+_ENTRY_DEFAULTS = ('Definição não disponível.', 'N/A', 'Exemplo não disponível.')
+_get_entry_fields = itemgetter(*_ENTRY_FIELDS)
+
+# Marca a ausência de uma resposta no cache de process_question (None registra palavra não encontrada)
+_UNCACHED = object()
 
 class TaskManager:
     """
@@ -17,6 +28,15 @@ class TaskManager:
     - Integrar funcionalidades de reconhecimento e síntese de voz.
     """
 
+    # Atributos fixos: sem __dict__ por instância e com acesso direto nos métodos mais chamados
+    __slots__ = (
+        'logger', 'dictionary_manager', 'definition_module', 'confidence_module', 'speech_module',
+        'language', '_qcache', '_qcache_revision'
+    )
+
+    # Quantidade máxima de respostas de process_question mantidas em memória
+    QUESTION_CACHE_SIZE = 4096
+
     def __init__(
         self,
         language: str = 'en',
@@ -42,15 +62,24 @@ class TaskManager:
             language_data_path=language_data_path,
             export_csv_path=export_csv_path
         )
+        # Compartilha os dados já carregados pelo DictionaryManager, sem uma segunda leitura dos arquivos
         self.definition_module = DefinitionModule(
             language=language,
             dictionary_path=dictionary_path,
-            language_data_path=language_data_path
+            language_data_path=language_data_path,
+            dictionary_manager=self.dictionary_manager
         )
         self.confidence_module = ConfidenceModule()
         self.speech_module = SpeechModule(language=language)
+        # Prepara microfone e síntese de voz em segundo plano, tirando esse custo da primeira consulta por voz
+        threading.Thread(target=self.speech_module.prewarm, name='speech-prewarm', daemon=True).start()
         
-        self.language = language
+        # Internado como as chaves de idioma do dicionário: comparações e hashing por identidade
+        self.language = sys.intern(language)
+        # Respostas por (palavra normalizada, idioma), válidas enquanto a revisão do dicionário não mudar;
+        # None registra uma palavra não encontrada
+        self._qcache: Dict[Tuple[str, str], Optional[dict]] = {}
+        self._qcache_revision = self.dictionary_manager.revision
         self.logger.info("TaskManager inicializado com sucesso.")
 
     def set_language(self, language: str) -> bool:
@@ -63,16 +92,17 @@ class TaskManager:
         Retorna:
         - bool: True se o idioma foi definido com sucesso, False caso contrário.
         """
-        self.logger.info(f"Tentando definir o idioma para '{language}'.")
+        self.logger.info("Tentando definir o idioma para '%s'.", language)
         success = self.dictionary_manager.set_language(language)
         if not success:
-            self.logger.error(f"Falha ao definir o idioma para '{language}'.")
+            self.logger.error("Falha ao definir o idioma para '%s'.", language)
             return False
 
-        self.language = language
+        self.language = sys.intern(language)
+        self._qcache.clear()
         self.definition_module.set_language(language)
         self.speech_module.set_language(language)
-        self.logger.info(f"Idioma definido para '{language}' com sucesso.")
+        self.logger.info("Idioma definido para '%s' com sucesso.", language)
         return True
 
     def process_question(self, word: str) -> dict:
@@ -86,19 +116,60 @@ class TaskManager:
         - dict: Contendo 'definition', 'part_of_speech', 'example' e 'confidence' se a palavra existir.
         - dict: Contendo 'error' se a palavra não for encontrada.
         """
-        self.logger.info(f"Processando a palavra: '{word}' no idioma '{self.language}'.")
+        self.logger.info("Processando a palavra: '%s' no idioma '%s'.", word, self.language)
+
+        # Qualquer alteração no dicionário (adição, remoção, importação) invalida as respostas guardadas
+        revision = self.dictionary_manager.revision
+        if revision != self._qcache_revision:
+            self._qcache.clear()
+            self._qcache_revision = revision
+
+        # A chave usa a mesma normalização do dicionário: grafias que levam à mesma entrada compartilham a resposta
+        key = (_norm_key(word), self.language)
+        result = self._qcache.get(key, _UNCACHED)
+        if result is _UNCACHED:
+            result = self._answer(word)
+            if len(self._qcache) >= self.QUESTION_CACHE_SIZE:
+                try:
+                    # Descarta a resposta mais antiga; um clear() concorrente pode ter esvaziado o cache
+                    del self._qcache[next(iter(self._qcache))]
+                except (StopIteration, KeyError):
+                    pass
+            self._qcache[key] = result
+
+        if result is None:
+            # A mensagem de erro usa a grafia desta consulta, por isso não é guardada no cache
+            self.logger.warning("Palavra '%s' não encontrada no dicionário.", word)
+            return {"error": f"Palavra '{word}' não encontrada no dicionário."}
+        # Cópia para que o chamador não altere a resposta guardada
+        return dict(result)
+
+    def _answer(self, word: str) -> Optional[dict]:
+        """
+        Monta a resposta de process_question consultando o dicionário, sem cache.
+
+        Parâmetros:
+        - word (str): Palavra a ser processada.
+
+        Retorna:
+        - dict: Resposta no formato de process_question, para uma palavra encontrada.
+        - None: Se a palavra não for encontrada.
+        """
         definition_data = self.dictionary_manager.get_definition(word, self.language)
         
         if not definition_data:
-            self.logger.warning(f"Palavra '{word}' não encontrada no dicionário.")
-            return {"error": f"Palavra '{word}' não encontrada no dicionário."}
+            return None
         
-        definition = definition_data.get('definition', 'Definição não disponível.')
-        part_of_speech = definition_data.get('part_of_speech', 'N/A')
-        example = definition_data.get('example', 'Exemplo não disponível.')
+        try:
+            definition, part_of_speech, example = _get_entry_fields(definition_data)
+        except KeyError:
+            definition, part_of_speech, example = (
+                definition_data.get(field, default) for field, default in zip(_ENTRY_FIELDS, _ENTRY_DEFAULTS)
+            )
         confidence = self.confidence_module.calculate_confidence(definition, example)
         
-        self.logger.debug(f"Confiança calculada para '{word}': {confidence:.2f}%.")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Confiança calculada para '%s': %.2f%%.", word, confidence)
         
         return {
             "definition": definition,
@@ -107,6 +178,19 @@ class TaskManager:
             "confidence": confidence
         }
 
+    def prefix_search(self, prefix: str, k: int = 10) -> List[str]:
+        """
+        Sugere palavras do idioma atual que começam com o prefixo informado (autocompletar).
+
+        Parâmetros:
+        - prefix (str): Prefixo digitado pelo usuário.
+        - k (int): Quantidade máxima de sugestões.
+
+        Retorna:
+        - list: Até k palavras em ordem alfabética.
+        """
+        return self.dictionary_manager.prefix_search(prefix, self.language, k)
+
     def listen_and_respond(self):
         """
         Captura a fala do usuário, processa e responde com áudio.
@@ -114,19 +198,20 @@ class TaskManager:
         self.logger.info("Iniciando reconhecimento de fala.")
         word = self.speech_module.recognize_speech()
         if word:
-            self.logger.info(f"Palavra reconhecida: '{word}'. Processando...")
+            self.logger.info("Palavra reconhecida: '%s'. Processando...", word)
             result = self.process_question(word)
             if 'error' in result:
-                self.logger.info(f"Respondendo com erro: {result['error']}")
+                self.logger.info("Respondendo com erro: %s", result['error'])
                 self.speech_module.speak(result['error'])
             else:
-                response_text = (
-                    f"Definição: {result['definition']}. "
-                    f"Exemplo: {result['example']}. "
+                # Falada por frases: o áudio começa assim que a primeira estiver sintetizada
+                sentences = (
+                    f"Definição: {result['definition']}.",
+                    f"Exemplo: {result['example']}.",
                     f"Confiança: {result['confidence']:.2f} por cento."
                 )
-                self.logger.info(f"Respondendo: {response_text}")
-                self.speech_module.speak(response_text)
+                self.logger.info("Respondendo: %s", " ".join(sentences))
+                self.speech_module.speak_stream(sentences)
         else:
             self.logger.warning("Nenhuma palavra foi reconhecida.")
 
@@ -141,11 +226,11 @@ class TaskManager:
         Retorna:
         - tuple: (bool, str) indicando sucesso e mensagem.
         """
-        self.logger.info(f"Exportando dicionário para CSV. Idioma: '{language}'.")
+        self.logger.info("Exportando dicionário para CSV. Idioma: '%s'.", language)
         success = self.dictionary_manager.export_dictionary_to_csv(language, csv_path)
         if success:
             export_path = csv_path if csv_path else self.dictionary_manager.export_csv_path
-            self.logger.info(f"Dicionário exportado com sucesso para '{export_path}'.")
+            self.logger.info("Dicionário exportado com sucesso para '%s'.", export_path)
             return True, f"Dicionário exportado com sucesso para '{export_path}'."
         else:
             self.logger.error("Falha na exportação do dicionário para CSV.")
@@ -162,10 +247,12 @@ class TaskManager:
         Retorna:
         - tuple: (bool, str) indicando sucesso e mensagem.
         """
-        self.logger.info(f"Importando dicionário a partir de '{csv_path}'. Idioma: '{language}'.")
-        success, message = self.dictionary_manager.import_dictionary_from_csv(csv_path, language)
+        self.logger.info("Importando dicionário a partir de '%s'. Idioma: '%s'.", csv_path, language)
+        # Em lote: o dicionário é salvo e o CSV de exportação regerado uma única vez, ao final
+        with self.dictionary_manager:
+            success, message = self.dictionary_manager.import_dictionary_from_csv(csv_path, language)
         if success:
-            self.logger.info(f"Dicionário importado com sucesso a partir de '{csv_path}'.")
+            self.logger.info("Dicionário importado com sucesso a partir de '%s'.", csv_path)
         else:
-            self.logger.error(f"Falha ao importar dicionário a partir de '{csv_path}': {message}")
+            self.logger.error("Falha ao importar dicionário a partir de '%s': %s", csv_path, message)
         return success, message
@@ -3,11 +3,33 @@
 import tkinter as tk
 from tkinter import scrolledtext, ttk, messagebox, simpledialog, filedialog
 import logging
-import threading
+from concurrent.futures import ThreadPoolExecutor
 
 class QAInterface:
     """Interface gráfica para o A.U.R.E.L.I.O."""
 
+    # Atributos fixos (módulos, widgets e estado): sem __dict__ por instância
+    __slots__ = (
+        'root', 'task_manager', 'logger', '_pool', '_req_id', '_query_future',
+        'title_label', 'instruction_label', 'word_entry', 'buttons_frame',
+        'ask_button', 'voice_button', 'add_word_button', 'export_button', 'import_button',
+        'language_label', 'language_options', 'language_var', 'language_dropdown',
+        'result_label', 'result_text', 'confidence_label'
+    )
+
+    # Estilos reaproveitados pelos widgets, em vez de repetir as mesmas opções em cada chamada
+    _DARK_BG = '#1e1e1e'
+    _FIELD_FONT = ("Helvetica", 12)
+    _LABEL_STYLE = {'font': ("Helvetica", 14), 'fg': "white", 'bg': _DARK_BG}
+    _FIELD_LABEL_STYLE = {'font': _FIELD_FONT, 'fg': "white", 'bg': _DARK_BG}
+    _HIGHLIGHT_STYLE = {'fg': "#FFEB3B", 'bg': _DARK_BG}
+    _ENTRY_STYLE = {'font': ("Helvetica", 14), 'bg': "#333", 'fg': "white", 'insertbackground': "white"}
+    _BUTTON_STYLE = {'font': ("Helvetica", 14), 'fg': "white"}
+    _BOLD_BUTTON_STYLE = {'font': ("Helvetica", 14, "bold"), 'fg': "white"}
+
+    # Threads de trabalho para consultas, API e voz; limita a concorrência entre cliques seguidos
+    WORKER_THREADS = 2
+
     def __init__(self, root, task_manager):
         """
         Inicializa a interface gráfica com os módulos necessários.
@@ -19,12 +41,46 @@ class QAInterface:
         self.root = root
         self.task_manager = task_manager
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._pool = ThreadPoolExecutor(max_workers=self.WORKER_THREADS, thread_name_prefix='aurelio-io')
+        # Identificador da consulta mais recente; apenas ela atualiza a área de resultados
+        self._req_id = 0
+        self._query_future = None
         self.create_widgets()
 
+    def _submit(self, callback, fn, *args):
+        """
+        Executa uma função no pool de threads e entrega o resultado à thread da interface.
+
+        Widgets do Tkinter só podem ser alterados pela thread principal; por isso o Future concluído
+        é repassado a `callback` via root.after, em vez de a thread de trabalho atualizar a interface.
+
+        Parâmetros:
+        - callback (callable): Função chamada na thread da interface com o Future concluído.
+        - fn (callable): Função executada no pool.
+        - *args: Argumentos de `fn`.
+
+        Retorna:
+        - Future: Execução agendada.
+        """
+        def deliver(future):
+            try:
+                self.root.after(0, callback, future)
+            except (RuntimeError, tk.TclError):
+                # A janela já foi fechada; não há o que atualizar
+                pass
+
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(deliver)
+        return future
+
+    def close(self):
+        """Encerra o pool de threads, descartando tarefas ainda não iniciadas."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
     def create_widgets(self):
         """Cria os componentes da interface gráfica."""
 
-        self.root.configure(bg='#1e1e1e')  # Define a cor de fundo da janela principal
+        self.root.configure(bg=self._DARK_BG)  # Define a cor de fundo da janela principal
         self.root.geometry("800x600")  # Define o tamanho inicial da janela
         self.root.resizable(False, False)  # Impede o redimensionamento da janela
 
@@ -33,8 +89,7 @@ class QAInterface:
             self.root, 
             text="A.U.R.E.L.I.O. - Dicionário Multilíngue", 
             font=("Helvetica", 24, "bold"), 
-            fg="#FFEB3B", 
-            bg='#1e1e1e'
+            **self._HIGHLIGHT_STYLE
         )
         self.title_label.pack(pady=10)
 
@@ -42,36 +97,26 @@ class QAInterface:
         self.instruction_label = tk.Label(
             self.root, 
             text="Digite uma palavra para obter sua definição e um exemplo de uso.", 
-            font=("Helvetica", 14), 
-            fg="white", 
-            bg='#1e1e1e'
+            **self._LABEL_STYLE
         )
         self.instruction_label.pack(pady=5)
 
         # Campo de entrada da palavra
-        self.word_entry = tk.Entry(
-            self.root, 
-            font=("Helvetica", 14), 
-            width=50, 
-            bg="#333", 
-            fg="white", 
-            insertbackground="white"
-        )
+        self.word_entry = tk.Entry(self.root, width=50, **self._ENTRY_STYLE)
         self.word_entry.pack(pady=10)
         self.word_entry.bind('<Return>', lambda event: self.process_question())
 
         # Botões de ação
-        self.buttons_frame = tk.Frame(self.root, bg='#1e1e1e')
+        self.buttons_frame = tk.Frame(self.root, bg=self._DARK_BG)
         self.buttons_frame.pack(pady=10)
 
         # Botão para buscar definição
         self.ask_button = tk.Button(
             self.buttons_frame, 
             text="Buscar Definição", 
-            font=("Helvetica", 14, "bold"), 
             bg="#4CAF50", 
-            fg="white", 
-            command=self.process_question
+            command=self.process_question,
+            **self._BOLD_BUTTON_STYLE
         )
         self.ask_button.grid(row=0, column=0, padx=10, pady=5)
 
@@ -79,10 +124,9 @@ class QAInterface:
         self.voice_button = tk.Button(
             self.buttons_frame, 
             text="🎤 Falar", 
-            font=("Helvetica", 14), 
             bg="#FF5722", 
-            fg="white", 
-            command=self.start_voice_query
+            command=self.start_voice_query,
+            **self._BUTTON_STYLE
         )
         self.voice_button.grid(row=0, column=1, padx=10, pady=5)
 
@@ -90,10 +134,9 @@ class QAInterface:
         self.add_word_button = tk.Button(
             self.buttons_frame, 
             text="➕ Adicionar Palavra", 
-            font=("Helvetica", 14), 
             bg="#2196F3", 
-            fg="white", 
-            command=self.add_new_word
+            command=self.add_new_word,
+            **self._BUTTON_STYLE
         )
         self.add_word_button.grid(row=0, column=2, padx=10, pady=5)
 
@@ -101,10 +144,9 @@ class QAInterface:
         self.export_button = tk.Button(
             self.buttons_frame, 
             text="📤 Exportar Dicionário", 
-            font=("Helvetica", 14), 
             bg="#9C27B0", 
-            fg="white", 
-            command=self.export_dictionary
+            command=self.export_dictionary,
+            **self._BUTTON_STYLE
         )
         self.export_button.grid(row=0, column=3, padx=10, pady=5)
 
@@ -112,25 +154,19 @@ class QAInterface:
         self.import_button = tk.Button(
             self.buttons_frame, 
             text="📥 Importar Dicionário", 
-            font=("Helvetica", 14), 
             bg="#FFC107", 
-            fg="white", 
-            command=self.import_dictionary
+            command=self.import_dictionary,
+            **self._BUTTON_STYLE
         )
         self.import_button.grid(row=0, column=4, padx=10, pady=5)
 
         # Dropdown para seleção de idioma
-        self.language_label = tk.Label(
-            self.root, 
-            text="Idioma:", 
-            font=("Helvetica", 14), 
-            fg="white", 
-            bg='#1e1e1e'
-        )
+        self.language_label = tk.Label(self.root, text="Idioma:", **self._LABEL_STYLE)
         self.language_label.pack(pady=5)
 
-        self.language_options = ["en", "pt", "es", "fr"]
-        self.language_var = tk.StringVar(value="en")
+        # Idiomas lidos de language_data.json uma única vez, pelo DictionaryManager
+        self.language_options = self.task_manager.dictionary_manager.available_languages()
+        self.language_var = tk.StringVar(value=self.task_manager.language)
         self.language_dropdown = ttk.Combobox(
             self.root, 
             textvariable=self.language_var, 
@@ -142,13 +178,7 @@ class QAInterface:
         self.language_dropdown.bind("<<ComboboxSelected>>", self.change_language)
 
         # Área de resultados
-        self.result_label = tk.Label(
-            self.root, 
-            text="Resultado:", 
-            font=("Helvetica", 14), 
-            fg="white", 
-            bg='#1e1e1e'
-        )
+        self.result_label = tk.Label(self.root, text="Resultado:", **self._LABEL_STYLE)
         self.result_label.pack(pady=5)
 
         self.result_text = scrolledtext.ScrolledText(
@@ -168,8 +198,7 @@ class QAInterface:
             self.root, 
             text="Confiança: N/A", 
             font=("Helvetica", 12, "bold"), 
-            fg="#FFEB3B", 
-            bg='#1e1e1e'
+            **self._HIGHLIGHT_STYLE
         )
         self.confidence_label.pack(pady=5)
 
@@ -181,54 +210,74 @@ class QAInterface:
             return
 
         language = self.language_var.get()
-        self.logger.info(f"Buscando definição para a palavra: '{word}' no idioma: '{language}'")
+        self.logger.info("Buscando definição para a palavra: '%s' no idioma: '%s'", word, language)
         self.display_loading()
 
-        # Iniciar processamento em uma thread separada para manter a interface responsiva
-        threading.Thread(target=self.fetch_and_display, args=(word,), daemon=True).start()
+        # Uma nova consulta torna as anteriores obsoletas; a que ainda não começou é cancelada
+        # e uma resposta falada em andamento é interrompida
+        self._req_id += 1
+        rid = self._req_id
+        if self._query_future is not None:
+            self._query_future.cancel()
+        self.task_manager.speech_module.stop()
+
+        # Processa no pool de threads para manter a interface responsiva
+        self._query_future = self._submit(
+            lambda future: self.display_result(word, rid, future),
+            self.fetch_and_display, word, rid
+        )
+
+    def fetch_and_display(self, word, rid):
+        """
+        Busca a definição da palavra; executado no pool de threads, sem tocar na interface.
 
-    def fetch_and_display(self, word):
-        """Busca a definição e atualiza a interface com o resultado."""
-        language = self.language_var.get()
+        Retorna None sem consultar nada se outra consulta já tiver sido feita depois desta.
+        """
+        if rid != self._req_id:
+            return None
+        return self.task_manager.process_question(word)
+
+    def display_result(self, word, rid, future):
+        """Atualiza a interface com o resultado da busca, se ainda for o mais recente; executado na thread da interface."""
+        if rid != self._req_id:
+            return
         try:
-            result = self.task_manager.process_question(word)
-            self.result_text.config(state='normal')
-            self.result_text.delete(1.0, tk.END)
+            result = future.result()
             if "error" in result:
-                self.result_text.insert(tk.END, result['error'])
+                self.set_result_text(result['error'])
                 self.confidence_label.config(text="Confiança: N/A")
             else:
-                definition = result['definition']
-                part_of_speech = result['part_of_speech']
-                example = result['example']
-                confidence = result['confidence']
-
-                output = (
-                    f"Definição: {definition}\n"
-                    f"Classe Gramatical: {part_of_speech}\n"
-                    f"Exemplo: {example}\n"
-                )
-                self.result_text.insert(tk.END, output)
-                self.confidence_label.config(text=f"Confiança: {confidence:.2f}%")
-                self.logger.info(f"Definição e exemplo exibidos para '{word}'.")
-            self.result_text.config(state='disabled')
+                self.set_result_text(''.join((
+                    "Definição: ", result['definition'],
+                    "\nClasse Gramatical: ", result['part_of_speech'],
+                    "\nExemplo: ", result['example'], "\n"
+                )))
+                self.confidence_label.config(text=f"Confiança: {result['confidence']:.2f}%")
+                self.logger.info("Definição e exemplo exibidos para '%s'.", word)
         except Exception as e:
-            self.logger.error(f"Erro ao processar a palavra '{word}': {e}")
+            self.logger.error("Erro ao processar a palavra '%s': %s", word, e)
             messagebox.showerror("Erro", f"Ocorreu um erro ao processar a palavra '{word}'. Por favor, tente novamente.")
-            self.result_text.config(state='normal')
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, "Ocorreu um erro ao processar a solicitação.")
-            self.result_text.config(state='disabled')
+            self.set_result_text("Ocorreu um erro ao processar a solicitação.")
             self.confidence_label.config(text="Confiança: N/A")
         finally:
             self.remove_loading()
 
-    def display_loading(self):
-        """Exibe uma mensagem de carregamento."""
+    def set_result_text(self, text):
+        """
+        Substitui o conteúdo da área de resultados, que permanece somente leitura.
+
+        Usa Text.replace: uma única operação no Tk, sem o redesenho intermediário de delete + insert.
+
+        Parâmetros:
+        - text (str): Novo conteúdo.
+        """
         self.result_text.config(state='normal')
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, "Buscando definição, por favor aguarde...")
+        self.result_text.replace('1.0', tk.END, text)
         self.result_text.config(state='disabled')
+
+    def display_loading(self):
+        """Exibe uma mensagem de carregamento."""
+        self.set_result_text("Buscando definição, por favor aguarde...")
         self.confidence_label.config(text="Confiança: N/A")
 
     def remove_loading(self):
@@ -256,32 +305,39 @@ class QAInterface:
         # Tenta buscar definição automática
         confirm = messagebox.askyesno("Buscar Definição", f"Deseja buscar a definição de '{word}' automaticamente?")
         if confirm:
-            self.logger.info(f"Buscando definição automática para '{word}'.")
+            self.logger.info("Buscando definição automática para '%s'.", word)
             self.display_loading()
 
-            # Iniciar busca em uma thread separada
-            threading.Thread(target=self.fetch_and_add_word, args=(word, language), daemon=True).start()
+            # Busca no pool de threads; o resultado é tratado na thread da interface
+            self._submit(
+                lambda future: self.on_word_fetched(word, language, future),
+                self.fetch_and_add_word, word, language
+            )
         else:
             # Solicita definição manual
             self.open_manual_add_window(word, language)
 
     def fetch_and_add_word(self, word, language):
-        """Busca a definição via API e adiciona a palavra ao dicionário."""
+        """Busca a definição via API e adiciona a palavra ao dicionário; executado no pool de threads."""
+        return self.task_manager.dictionary_manager.add_word(word, language)
+
+    def on_word_fetched(self, word, language, future):
+        """Informa o resultado da adição via API; executado na thread da interface."""
         try:
-            success, message = self.task_manager.dictionary_manager.add_word(word, language)
+            success, message = future.result()
             if success:
                 messagebox.showinfo("Sucesso", message)
-                self.logger.info(f"Palavra '{word}' adicionada com sucesso via API.")
+                self.logger.info("Palavra '%s' adicionada com sucesso via API.", word)
             else:
                 if "manualmente" in message:
                     # Solicita definição manual
-                    self.logger.info(f"Definição automática não disponível para '{word}'. Solicitando entrada manual.")
+                    self.logger.info("Definição automática não disponível para '%s'. Solicitando entrada manual.", word)
                     self.open_manual_add_window(word, language)
                 else:
                     messagebox.showerror("Erro", message)
-                    self.logger.error(f"Erro ao adicionar palavra '{word}': {message}")
+                    self.logger.error("Erro ao adicionar palavra '%s': %s", word, message)
         except Exception as e:
-            self.logger.error(f"Erro ao adicionar palavra '{word}': {e}")
+            self.logger.error("Erro ao adicionar palavra '%s': %s", word, e)
             messagebox.showerror("Erro", f"Ocorreu um erro ao adicionar a palavra '{word}'. Por favor, tente novamente.")
         finally:
             self.remove_loading()
@@ -291,30 +347,29 @@ class QAInterface:
         add_window = tk.Toplevel(self.root)
         add_window.title(f"Adicionar Palavra: {word}")
         add_window.geometry("500x500")
-        add_window.configure(bg='#1e1e1e')
+        add_window.configure(bg=self._DARK_BG)
 
         # Título da Janela
         tk.Label(
             add_window, 
             text=f"Adicionar '{word}' Manualmente", 
             font=("Helvetica", 16, "bold"), 
-            fg="#FFEB3B", 
-            bg='#1e1e1e'
+            **self._HIGHLIGHT_STYLE
         ).pack(pady=10)
 
         # Definição
-        tk.Label(add_window, text="Definição:", font=("Helvetica", 12), fg="white", bg='#1e1e1e').pack(pady=5)
-        definition_text = scrolledtext.ScrolledText(add_window, width=60, height=5, font=("Helvetica", 12))
+        tk.Label(add_window, text="Definição:", **self._FIELD_LABEL_STYLE).pack(pady=5)
+        definition_text = scrolledtext.ScrolledText(add_window, width=60, height=5, font=self._FIELD_FONT)
         definition_text.pack(pady=5)
 
         # Classe Gramatical
-        tk.Label(add_window, text="Classe Gramatical:", font=("Helvetica", 12), fg="white", bg='#1e1e1e').pack(pady=5)
-        pos_entry = tk.Entry(add_window, width=30, font=("Helvetica", 12))
+        tk.Label(add_window, text="Classe Gramatical:", **self._FIELD_LABEL_STYLE).pack(pady=5)
+        pos_entry = tk.Entry(add_window, width=30, font=self._FIELD_FONT)
         pos_entry.pack(pady=5)
 
         # Exemplo
-        tk.Label(add_window, text="Exemplo de Uso:", font=("Helvetica", 12), fg="white", bg='#1e1e1e').pack(pady=5)
-        example_text = scrolledtext.ScrolledText(add_window, width=60, height=5, font=("Helvetica", 12))
+        tk.Label(add_window, text="Exemplo de Uso:", **self._FIELD_LABEL_STYLE).pack(pady=5)
+        example_text = scrolledtext.ScrolledText(add_window, width=60, height=5, font=self._FIELD_FONT)
         example_text.pack(pady=5)
 
         # Botão de Confirmação
@@ -327,7 +382,7 @@ class QAInterface:
                 messagebox.showwarning("Aviso", "Todos os campos são obrigatórios.")
                 return
 
-            self.logger.info(f"Adicionando palavra '{word}' manualmente.")
+            self.logger.info("Adicionando palavra '%s' manualmente.", word)
             success, message = self.task_manager.dictionary_manager.manual_add_word(
                 word=word,
                 language=language,
@@ -338,13 +393,13 @@ class QAInterface:
 
             if success:
                 messagebox.showinfo("Sucesso", message)
-                self.logger.info(f"Palavra '{word}' adicionada com sucesso manualmente.")
+                self.logger.info("Palavra '%s' adicionada com sucesso manualmente.", word)
                 add_window.destroy()
                 # Atualiza a interface para refletir a nova palavra
                 self.process_question()
             else:
                 messagebox.showerror("Erro", message)
-                self.logger.error(f"Erro ao adicionar palavra '{word}' manualmente: {message}")
+                self.logger.error("Erro ao adicionar palavra '%s' manualmente: %s", word, message)
 
         confirm_button = tk.Button(
             add_window, 
@@ -357,37 +412,45 @@ class QAInterface:
         confirm_button.pack(pady=20)
 
     def start_voice_query(self):
-        """Inicia a consulta por voz em uma thread separada."""
+        """Inicia a consulta por voz no pool de threads."""
         self.logger.info("Iniciando consulta por voz.")
-        threading.Thread(target=self.voice_query, daemon=True).start()
+        # A nova consulta substitui a anterior: interrompe a resposta falada ainda em andamento.
+        # _req_id não muda, pois a resposta por voz não é exibida na área de resultados
+        self.task_manager.speech_module.stop()
+        self._submit(self.on_voice_query_done, self.voice_query)
 
     def voice_query(self):
-        """Processa a consulta por voz."""
+        """Processa a consulta por voz; executado no pool de threads."""
+        self.logger.info("Esperando reconhecimento de fala...")
+        self.task_manager.listen_and_respond()
+        self.logger.info("Consulta por voz concluída.")
+
+    def on_voice_query_done(self, future):
+        """Informa erros da consulta por voz; executado na thread da interface."""
         try:
-            self.logger.info("Esperando reconhecimento de fala...")
-            self.task_manager.listen_and_respond()
-            self.logger.info("Consulta por voz concluída.")
+            future.result()
             # Opcional: Atualizar a interface após a resposta de voz
             # Dependendo da implementação de listen_and_respond, pode ser necessário obter o último resultado
         except Exception as e:
-            self.logger.error(f"Erro na consulta por voz: {e}")
+            self.logger.error("Erro na consulta por voz: %s", e)
             messagebox.showerror("Erro", "Ocorreu um erro durante a consulta por voz.")
 
     def change_language(self, event):
         """Altera o idioma do sistema baseado na seleção do usuário."""
         selected_language = self.language_var.get()
+        if selected_language == self.task_manager.language:
+            # Seleção repetida do idioma atual; nada a recarregar
+            return
         success = self.task_manager.set_language(selected_language)
         if success:
-            self.logger.info(f"Idioma alterado para '{selected_language}'.")
+            self.logger.info("Idioma alterado para '%s'.", selected_language)
             messagebox.showinfo("Idioma Alterado", f"Idioma alterado para '{selected_language.upper()}'.")
             # Limpa os campos após a alteração de idioma
             self.word_entry.delete(0, tk.END)
-            self.result_text.config(state='normal')
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.config(state='disabled')
+            self.set_result_text("")
             self.confidence_label.config(text="Confiança: N/A")
         else:
-            self.logger.warning(f"Tentativa de alterar para idioma inexistente '{selected_language}'.")
+            self.logger.warning("Tentativa de alterar para idioma inexistente '%s'.", selected_language)
             messagebox.showerror("Erro", f"O idioma '{selected_language}' não está disponível.")
 
     def export_dictionary(self):
@@ -402,11 +465,11 @@ class QAInterface:
         if not csv_path:
             return  # O usuário cancelou a operação
 
-        self.logger.info(f"Exportando dicionário para '{csv_path}' no idioma '{language}'.")
+        self.logger.info("Exportando dicionário para '%s' no idioma '%s'.", csv_path, language)
         success, message = self.task_manager.export_dictionary(language, csv_path)
         if success:
             messagebox.showinfo("Sucesso", message)
-            self.logger.info(f"Dicionário exportado com sucesso para '{csv_path}'.")
+            self.logger.info("Dicionário exportado com sucesso para '%s'.", csv_path)
         else:
             messagebox.showerror("Erro", message)
             self.logger.error("Falha ao exportar o dicionário.")
@@ -423,16 +486,16 @@ class QAInterface:
         if not csv_path:
             return  # O usuário cancelou a operação
 
-        self.logger.info(f"Importando dicionário a partir de '{csv_path}' para o idioma '{language}'.")
+        self.logger.info("Importando dicionário a partir de '%s' para o idioma '%s'.", csv_path, language)
         success, message = self.task_manager.import_dictionary(csv_path, language)
         if success:
             messagebox.showinfo("Sucesso", message)
-            self.logger.info(f"Dicionário importado com sucesso a partir de '{csv_path}'.")
+            self.logger.info("Dicionário importado com sucesso a partir de '%s'.", csv_path)
             # Atualiza a interface para refletir as novas palavras
             self.process_question()
         else:
             messagebox.showerror("Erro", message)
-            self.logger.error(f"Falha ao importar dicionário a partir de '{csv_path}': {message}")
+            self.logger.error("Falha ao importar dicionário a partir de '%s': %s", csv_path, message)
 
     def run(self):
         """Inicia a interface gráfica."""
@@ -1,9 +1,13 @@
 # main.py
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox
 from core.task_manager import TaskManager
 from interface.interface_gui import QAInterface
@@ -11,6 +15,13 @@ from interface.interface_gui import QAInterface
 def setup_logging():
     """
     Configura o sistema de logging para gravar logs tanto em arquivo quanto no console.
+
+    Os registros são apenas enfileirados pelas threads que os emitem; uma thread de fundo
+    (QueueListener) os grava no arquivo e no console, tirando a E/S do caminho das consultas.
+    A fila é esvaziada ao encerrar o processo.
+
+    Retorna:
+    - logging.handlers.QueueListener: Listener em execução.
     """
     log_dir = 'logs'
     os.makedirs(log_dir, exist_ok=True)  # Cria o diretório 'logs/' se não existir
@@ -25,40 +36,48 @@ def setup_logging():
     )
 
     # Handler para o arquivo de log
-    file_handler = logging.FileHandler(os.path.join(log_dir, 'qa_system.log'), encoding='utf-8')
+    file_handler = logging.FileHandler(os.path.join(log_dir, 'qa_system.log'), encoding='utf-8', delay=True)
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Handler para o console
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # Os handlers de arquivo e console são atendidos pela thread do listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     logger.info("Logging configurado com sucesso.")
+    return listener
 
-def on_closing(root, logger):
+def on_closing(root, logger, task_manager, interface):
     """
     Função chamada quando a janela principal é fechada.
 
     Parâmetros:
     - root (tk.Tk): Instância da janela principal do Tkinter.
     - logger (logging.Logger): Instância do logger para registrar o fechamento.
+    - task_manager (TaskManager): Instância do TaskManager, cujas alterações pendentes são gravadas.
+    - interface (QAInterface): Interface gráfica, cujo pool de threads é encerrado.
     """
     if messagebox.askokcancel("Sair", "Deseja realmente sair do A.U.R.E.L.I.O.?"):
         logger.info("Encerrando o A.U.R.E.L.I.O.")
+        interface.close()
+        task_manager.dictionary_manager.close()
         root.destroy()
 
 def check_and_create_directories():
     """
     Verifica e cria os diretórios necessários, como 'assets' para o ícone e 'data' para os arquivos do dicionário.
     """
-    required_dirs = ['assets', 'data', 'data/export']
-    for directory in required_dirs:
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            logging.info(f"Diretório '{directory}' criado.")
+    # exist_ok dispensa a verificação prévia de existência
+    for directory in ('assets', 'data', 'data/export'):
+        os.makedirs(directory, exist_ok=True)
 
 def load_icon(root, logger):
     """
@@ -69,14 +88,12 @@ def load_icon(root, logger):
     - logger (logging.Logger): Instância do logger para registrar o processo.
     """
     icon_path = os.path.join('assets', 'logo_icon.ico')  # Exemplo de caminho do ícone
-    if os.path.exists(icon_path):
-        try:
-            root.iconbitmap(icon_path)
-            logger.info(f"Ícone carregado a partir de '{icon_path}'.")
-        except Exception as e:
-            logger.warning(f"Falha ao carregar o ícone '{icon_path}': {e}")
-    else:
-        logger.warning(f"Ícone '{icon_path}' não encontrado. Continuando sem ícone.")
+    # iconbitmap já abre o arquivo; um ícone ausente é reportado pelo próprio Tk
+    try:
+        root.iconbitmap(icon_path)
+        logger.info(f"Ícone carregado a partir de '{icon_path}'.")
+    except (tk.TclError, OSError) as e:
+        logger.warning(f"Falha ao carregar o ícone '{icon_path}': {e}. Continuando sem ícone.")
 
 def main():
     """
@@ -90,25 +107,29 @@ def main():
         # Verifica e cria os diretórios necessários
         check_and_create_directories()
 
-        # Cria a janela principal do Tkinter
-        root = tk.Tk()
-        root.title("A.U.R.E.L.I.O. - Dicionário Multilíngue")
-        root.geometry("900x800")  # Define o tamanho da janela
-        root.resizable(False, False)  # Desativa o redimensionamento da janela
-        root.configure(bg='#1e1e1e')  # Define a cor de fundo
-        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='startup') as startup:
+            # O TaskManager (leitura dos dados) é criado em paralelo com a janela; ele não usa o Tk,
+            # que permanece restrito a esta thread
+            task_manager_future = startup.submit(TaskManager)
+
+            # Cria a janela principal do Tkinter
+            root = tk.Tk()
+            root.title("A.U.R.E.L.I.O. - Dicionário Multilíngue")
+            root.geometry("900x800")  # Define o tamanho da janela
+            root.resizable(False, False)  # Desativa o redimensionamento da janela
+            root.configure(bg='#1e1e1e')  # Define a cor de fundo
 
-        # Carregar o ícone
-        load_icon(root, logger)
+            # Carregar o ícone
+            load_icon(root, logger)
 
-        # Cria instância do TaskManager
-        task_manager = TaskManager()
+            # Aguarda a instância do TaskManager; exceções da inicialização são propagadas aqui
+            task_manager = task_manager_future.result()
 
         # Cria e executa a interface gráfica
         interface = QAInterface(root, task_manager)
 
         # Configura a função de fechamento da janela
-        root.protocol("WM_DELETE_WINDOW", lambda: on_closing(root, logger))
+        root.protocol("WM_DELETE_WINDOW", lambda: on_closing(root, logger, task_manager, interface))
 
         # Inicia a interface
         interface.run()
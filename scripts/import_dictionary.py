@@ -1,32 +1,280 @@
 # scripts/import_dictionary.py
 
+import argparse
+import csv
+import io
+import itertools
+import mmap
 import os
+from functools import lru_cache
+from multiprocessing import Pool
 from core.dictionary_manager import DictionaryManager
 
-def import_dictionary(csv_path, language):
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # PyArrow é opcional; sem ele a importação usa o leitor csv do DictionaryManager
+    pa = None
+    pacsv = None
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:  # charset-normalizer é opcional; sem ele o CSV é lido como UTF-8
+    from_bytes = None
+
+# Quantidade de bytes do início do arquivo usada para detectar a codificação
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Tamanho do bloco lido pelo PyArrow e número de linhas entregues ao dicionário por lote
+ARROW_BLOCK_SIZE = 8 << 20
+ARROW_BATCH_ROWS = 65536
+
+def _import_with_arrow(manager, csv_path, language, encoding='utf-8'):
+    """
+    Importa o CSV com o leitor multithread do PyArrow, entregando ao dicionário os registros lote a lote.
+
+    Parâmetros:
+    - manager (DictionaryManager): Gerenciador que recebe as palavras.
+    - csv_path (str): Caminho para o arquivo CSV de entrada.
+    - language (str): Código do idioma.
+    - encoding (str): Codificação do arquivo CSV.
+
+    Retorna:
+    - tuple: (bool, str) indicando sucesso e mensagem.
+    """
+    with open(csv_path, 'r', newline='', encoding=encoding) as csvfile:
+        header = next(csv.reader(csvfile), [])
+    # Todas as colunas são lidas como texto e só a célula vazia é nula: sem isso o PyArrow converteria
+    # 'N/A', 'NA', 'null' e 'nan' em nulos e inferiria colunas numéricas ou booleanas
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE, use_threads=True, encoding=encoding),
+        parse_options=pacsv.ParseOptions(delimiter=','),
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            null_values=[''],
+            strings_can_be_null=True
+        )
+    )
+    missing = [name for name in ('word', 'definition', 'part_of_speech') if name not in table.column_names]
+    if missing:
+        return False, f"Colunas obrigatórias ausentes no CSV: {', '.join(missing)}."
+
+    # Todos os lotes passam por uma única importação: um salvamento ao final e nada gravado se algum falhar
+    batches = (batch.to_pydict() for batch in table.to_batches(ARROW_BATCH_ROWS))
+    count_added, count_skipped = manager.import_arrow_batches(batches, language)
+    return True, f"Dicionário importado com sucesso. {count_added} palavras adicionadas, {count_skipped} palavras ignoradas."
+
+def _detect_encoding(csv_path):
+    """
+    Detecta a codificação do CSV a partir de uma amostra do início do arquivo.
+
+    Parâmetros:
+    - csv_path (str): Caminho para o arquivo CSV de entrada.
+
+    Retorna:
+    - str: Nome da codificação detectada, ou 'utf-8' se não for possível detectá-la.
+    """
+    if from_bytes is None:
+        return 'utf-8'
+    with open(csv_path, 'rb') as f:
+        sample = f.read(ENCODING_SAMPLE_SIZE)
+    # Arquivos UTF-8 válidos não precisam de detecção; se a amostra não cobre o arquivo inteiro,
+    # ela pode cortar um caractere multibyte no final
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        if len(sample) == ENCODING_SAMPLE_SIZE and e.start >= len(sample) - 3:
+            return 'utf-8'
+    best = from_bytes(sample).best()
+    return best.encoding if best is not None else 'utf-8'
+
+class _QuotedLineBreakError(ValueError):
+    """Um intervalo do modo paralelo começa dentro de um campo entre aspas com quebra de linha."""
+
+def _split_ranges(csv_path, workers):
+    """
+    Divide o corpo do CSV em intervalos de bytes que terminam em quebras de linha.
+
+    Parâmetros:
+    - csv_path (str): Caminho para o arquivo CSV de entrada.
+    - workers (int): Número desejado de intervalos.
+
+    Retorna:
+    - tuple: (linha de cabeçalho em bytes, lista de pares (início, fim)).
+    """
+    with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        header_end = mm.find(b'\n')
+        if header_end < 0:
+            return mm[:], []
+        start = header_end + 1
+        step = max(1, (size - start) // workers)
+        ranges = []
+        while start < size:
+            end = mm.find(b'\n', min(start + step, size - 1))
+            end = size if end < 0 else end + 1
+            ranges.append((start, end))
+            start = end
+        return mm[:header_end + 1], ranges
+
+def _parse_range(task):
+    """
+    Lê um intervalo de bytes do CSV e devolve seus registros (palavra, definição, classe gramatical, exemplo).
+
+    Executado nos processos de trabalho; a inserção no dicionário fica no processo principal.
+
+    Parâmetros:
+    - task (tuple): (caminho, início, fim, índices das colunas, codificação).
+
+    Retorna:
+    - tuple: (registros do intervalo na ordem do arquivo, número de aspas no intervalo).
+    """
+    csv_path, start, end, indices, encoding = task
+    with open(csv_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    quotes = data.count(b'"')
+    text = data.decode(encoding)
+    word_index, definition_index, part_of_speech_index, example_index = indices
+    width = max(index for index in indices if index is not None) + 1
+    rows = []
+    for row in csv.reader(io.StringIO(text, newline='')):
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+        rows.append((
+            row[word_index],
+            row[definition_index],
+            row[part_of_speech_index],
+            row[example_index] if example_index is not None else ''
+        ))
+    return rows, quotes
+
+def _checked_ranges(results, quotes_before):
+    """
+    Devolve, em ordem, os registros de cada intervalo interpretado em paralelo, verificando onde ele começa.
+
+    Como aspas escapadas aparecem em pares, um número ímpar de aspas antes do início de um intervalo
+    indica que ele começa dentro de um campo entre aspas com quebra de linha: os registros desse
+    intervalo e o último do anterior estariam cortados, então a leitura é interrompida com
+    _QuotedLineBreakError.
+
+    Parâmetros:
+    - results (Iterable[tuple]): Resultados de _parse_range, na ordem dos intervalos.
+    - quotes_before (int): Número de aspas antes do primeiro intervalo (no cabeçalho).
+
+    Retorna:
+    - Iterator[list]: Registros (palavra, definição, classe gramatical, exemplo) de cada intervalo.
+    """
+    for rows, quotes in results:
+        if quotes_before % 2:
+            raise _QuotedLineBreakError("Campo entre aspas com quebra de linha na divisão do CSV.")
+        yield rows
+        quotes_before += quotes
+
+def _import_in_parallel(manager, csv_path, language, workers, encoding='utf-8'):
+    """
+    Interpreta o CSV em paralelo, um intervalo de bytes por tarefa, e insere os registros em ordem.
+
+    Todos os intervalos alimentam uma única chamada a import_rows: se qualquer um falhar, nenhum
+    registro é incorporado ao dicionário. Os intervalos são alinhados a quebras de linha; se uma divisão
+    cair dentro de um campo entre aspas, o arquivo é importado novamente pelo leitor sequencial.
+
+    Parâmetros:
+    - manager (DictionaryManager): Gerenciador que recebe as palavras.
+    - csv_path (str): Caminho para o arquivo CSV de entrada.
+    - language (str): Código do idioma.
+    - workers (int): Número de processos.
+    - encoding (str): Codificação do arquivo CSV.
+
+    Retorna:
+    - tuple: (bool, str) indicando sucesso e mensagem.
+    """
+    header_line, ranges = _split_ranges(csv_path, workers)
+    header = [name.strip() for name in next(csv.reader([header_line.decode(encoding)]), [])]
+    missing = [name for name in ('word', 'definition', 'part_of_speech') if name not in header]
+    if missing:
+        return False, f"Colunas obrigatórias ausentes no CSV: {', '.join(missing)}."
+    indices = (
+        header.index('word'),
+        header.index('definition'),
+        header.index('part_of_speech'),
+        header.index('example') if 'example' in header else None
+    )
+
+    tasks = [(csv_path, start, end, indices, encoding) for start, end in ranges]
+    try:
+        # imap preserva a ordem dos intervalos, mantendo a primeira ocorrência de cada palavra
+        with Pool(workers) as pool:
+            results = _checked_ranges(pool.imap(_parse_range, tasks), header_line.count(b'"'))
+            count_added, count_skipped = manager.import_rows(itertools.chain.from_iterable(results), language)
+    except _QuotedLineBreakError:
+        # Nada foi incorporado ao dicionário; o leitor sequencial trata as quebras de linha entre aspas
+        return manager.import_dictionary_from_csv(csv_path, language, encoding)
+    return True, f"Dicionário importado com sucesso. {count_added} palavras adicionadas, {count_skipped} palavras ignoradas."
+
+def import_dictionary(csv_path, language, workers=1):
     """
     Importa palavras de um arquivo CSV para o dicionário.
     
     Parâmetros:
     - csv_path (str): Caminho para o arquivo CSV de entrada.
     - language (str): Código do idioma (ex: 'en', 'pt').
+    - workers (int): Número de processos para interpretar o CSV; 1 mantém a leitura sequencial.
     
     Retorna:
     - bool: True se importado com sucesso, False caso contrário.
     """
     manager = DictionaryManager()
-    success, message = manager.import_dictionary_from_csv(csv_path, language)
+    try:
+        encoding = _detect_encoding(csv_path) if os.path.exists(csv_path) else 'utf-8'
+        if workers > 1 and os.path.exists(csv_path):
+            try:
+                success, message = _import_in_parallel(manager, csv_path, language, workers, encoding)
+            except Exception as e:
+                success, message = False, f"Erro ao importar dicionário: {e}"
+        elif pacsv is not None and os.path.exists(csv_path):
+            try:
+                success, message = _import_with_arrow(manager, csv_path, language, encoding)
+            except Exception as e:
+                success, message = False, f"Erro ao importar dicionário: {e}"
+        else:
+            success, message = manager.import_dictionary_from_csv(csv_path, language, encoding)
+    finally:
+        manager.close()
     if success:
         print(message)
     else:
         print(f"Falha na importação: {message}")
+    return success
 
-if __name__ == "__main__":
-    import argparse
+@lru_cache(maxsize=None)
+def _build_parser():
+    """
+    Cria o parser de argumentos da linha de comando, construído uma única vez por processo.
 
+    Retorna:
+    - argparse.ArgumentParser: Parser com csv_path, language e --workers.
+    """
     parser = argparse.ArgumentParser(description="Importa palavras de um arquivo CSV para o dicionário.")
     parser.add_argument('csv_path', type=str, help="Caminho para o arquivo CSV de entrada.")
     parser.add_argument('language', type=str, help="Código do idioma (ex: 'en', 'pt').")
-    
-    args = parser.parse_args()
-    import_dictionary(args.csv_path, args.language)
+    parser.add_argument('--workers', type=int, default=1, help="Número de processos para interpretar o CSV.")
+    return parser
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Parâmetros:
+    - argv (list, opcional): Argumentos a interpretar; por padrão, os de sys.argv.
+
+    Retorna:
+    - bool: True se importado com sucesso, False caso contrário.
+    """
+    args = _build_parser().parse_args(argv)
+    return import_dictionary(args.csv_path, args.language, args.workers)
+
+if __name__ == "__main__":
+    main()
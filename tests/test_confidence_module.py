@@ -1,12 +1,14 @@
 ﻿# tests/test_confidence_module.py
 
 import unittest
+from unittest.mock import patch
 from core.confidence_module import ConfidenceModule
 
 class TestConfidenceModule(unittest.TestCase):
-    def setUp(self):
-        """Configuração antes de cada teste."""
-        self.conf_module = ConfidenceModule()
+    @classmethod
+    def setUpClass(cls):
+        """Configuração única para a classe; nenhum teste altera o módulo."""
+        cls.conf_module = ConfidenceModule()
 
     def test_calculate_confidence_high(self):
         """Testa o cálculo de confiança alta quando definição e exemplo estão presentes."""
@@ -128,5 +130,29 @@ class TestConfidenceModule(unittest.TestCase):
         confidence = self.conf_module.calculate_confidence(definition, example)
         self.assertEqual(confidence, 100.0, f"Esperado 100.0, obtido {confidence}")
 
+    def test_calculate_confidence_cached_repeat(self):
+        """Testa se chamadas repetidas com entradas longas reutilizam o cache sem alterar o resultado."""
+        definition = "A round fruit with red or green skin and a whitish interior."
+        example = "I ate a delicious apple for breakfast."
+        first = self.conf_module.calculate_confidence(definition, example)
+        hits_before = ConfidenceModule._compute.cache_info().hits
+        second = self.conf_module.calculate_confidence(definition, example)
+        self.assertEqual(first, second)
+        self.assertEqual(ConfidenceModule._compute.cache_info().hits, hits_before + 1)
+
+    def test_calculate_confidence_batch_matches_single(self):
+        """Testa se o cálculo em lote produz os mesmos valores do cálculo individual."""
+        definitions = ["A round fruit.", "", "   ", "A round fruit.", None, " ".join(["word"] * 60)]
+        examples = ["I ate a delicious apple.", "I ate a delicious apple.", "", "", None, " ".join(["example"] * 60)]
+        expected = [self.conf_module.calculate_confidence(d, e) for d, e in zip(definitions, examples)]
+        self.assertEqual(self.conf_module.calculate_confidence_batch(definitions, examples), expected)
+        with patch('core.confidence_module.np', None):
+            self.assertEqual(self.conf_module.calculate_confidence_batch(definitions, examples), expected)
+
+    def test_calculate_confidence_batch_length_mismatch(self):
+        """Testa se o cálculo em lote rejeita listas de tamanhos diferentes."""
+        with self.assertRaises(ValueError):
+            self.conf_module.calculate_confidence_batch(["A round fruit."], [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,13 +1,24 @@
 # tests/test_definition_module.py
 
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+from core import storage
 from core.definition_module import DefinitionModule
+from core.dictionary_manager import DictionaryManager
 
 class TestDefinitionModule(unittest.TestCase):
-    def setUp(self):
-        """Configuração antes de cada teste."""
-        self.def_module = DefinitionModule(language='en')
+    @classmethod
+    def setUpClass(cls):
+        """Configuração única para a classe; o módulo é compartilhado entre os testes."""
+        cls.def_module = DefinitionModule(language='en')
+
+    def tearDown(self):
+        """Restaura o idioma do módulo compartilhado caso algum teste o tenha alterado."""
+        if self.def_module.language != 'en':
+            self.def_module.set_language('en')
 
     @patch('core.definition_module.DefinitionModule.get_definition')
     def test_get_definition_existing_word(self, mock_get_definition):
@@ -153,5 +164,84 @@ class TestDefinitionModule(unittest.TestCase):
             self.assertEqual(result['part_of_speech'], "substantivo")
             mock_get_definition.assert_called_once_with(word)
 
+    def test_get_example_cache_invalidated_on_change(self):
+        """Testa se o cache de exemplos é descartado quando o dicionário é alterado."""
+        def_module = DefinitionModule(language='en', autosave=False)
+        def_module.dictionary = {'en': {}}
+        self.assertEqual(def_module.get_example("kiwi"), "Exemplo de uso para 'kiwi' não encontrado.")
+        def_module.add_word("kiwi", "A small brown fruit.", "noun", "I ate a kiwi.")
+        self.assertEqual(def_module.get_example("kiwi"), "I ate a kiwi.")
+        self.assertEqual(def_module.get_example("kiwi"), "I ate a kiwi.")
+        self.assertEqual(def_module._example_cache.cache_info().hits, 1)
+
+    def test_add_word_appends_to_journal(self):
+        """Testa se a adição é registrada no journal e aplicada ao recarregar, até a compactação."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dictionary_path = os.path.join(tmpdir, 'dictionary.json')
+            with open(dictionary_path, 'w', encoding='utf-8') as f:
+                json.dump({'en': {}}, f)
+
+            def_module = DefinitionModule(language='en', dictionary_path=dictionary_path)
+            self.assertTrue(def_module.add_word("kiwi", "A small brown fruit.", "noun"))
+            self.assertTrue(os.path.exists(dictionary_path + '.wal'))
+            with open(dictionary_path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), {'en': {}})
+
+            reloaded = DefinitionModule(language='en', dictionary_path=dictionary_path)
+            self.assertEqual(reloaded.get_definition("kiwi")['definition'], "A small brown fruit.")
+
+            self.assertTrue(reloaded.compact())
+            self.assertFalse(os.path.exists(dictionary_path + '.wal'))
+            with open(dictionary_path, encoding='utf-8') as f:
+                self.assertIn('kiwi', json.load(f)['en'])
+
+    def test_snapshot_keys_normalized(self):
+        """Testa se um snapshot com chaves não normalizadas (gravado pelo DictionaryManager) é normalizado ao carregar."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dictionary_path = os.path.join(tmpdir, 'dictionary.json')
+            dictionary = {'en': {'Kiwi': {'definition': "A small brown fruit.", 'part_of_speech': "noun"}}}
+            storage.dump_json(dictionary, dictionary_path)
+            storage.write_snapshot(dictionary, dictionary_path)
+
+            with patch('core.definition_module.storage.load_json') as load_json:
+                def_module = DefinitionModule(language='en', dictionary_path=dictionary_path)
+                self.assertEqual(list(def_module.dictionary['en']), ['kiwi'])
+                load_json.assert_not_called()
+            self.assertEqual(def_module.get_definition("kiwi")['definition'], "A small brown fruit.")
+
+    def test_get_definition_is_read_only(self):
+        """Testa se a definição retornada não permite alterar o dicionário interno."""
+        def_module = DefinitionModule(language='en', autosave=False)
+        def_module.dictionary = {'en': {'kiwi': {'definition': "A small brown fruit.", 'part_of_speech': "noun"}}}
+        result = def_module.get_definition("kiwi")
+        with self.assertRaises(TypeError):
+            result['definition'] = "Changed."
+        self.assertEqual(def_module.dictionary['en']['kiwi']['definition'], "A small brown fruit.")
+
+    def test_shared_dictionary_manager(self):
+        """Testa se, com um DictionaryManager compartilhado, os dados não são relidos e as alterações passam por ele."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dictionary_path = os.path.join(tmpdir, 'dictionary.json')
+            language_data_path = os.path.join(tmpdir, 'language.json')
+            manager = DictionaryManager(
+                dictionary_path=dictionary_path,
+                language_data_path=language_data_path,
+                export_csv_path=os.path.join(tmpdir, 'export.csv')
+            )
+            with patch('core.definition_module.storage.load_json') as load_json:
+                def_module = DefinitionModule(language='en', dictionary_manager=manager)
+                manager.manual_add_word("kiwi", "en", "A small brown fruit.", "noun", "I ate a kiwi.")
+                self.assertEqual(def_module.get_definition("kiwi")['definition'], "A small brown fruit.")
+                self.assertEqual(def_module.get_example("kiwi"), "I ate a kiwi.")
+
+                self.assertTrue(def_module.add_word("fig", "A soft sweet fruit.", "noun"))
+                self.assertEqual(manager.get_definition("fig", "en")['definition'], "A soft sweet fruit.")
+                self.assertTrue(def_module.remove_word("kiwi"))
+                self.assertIsNone(def_module.get_definition("kiwi"))
+                self.assertIsNone(manager.get_definition("kiwi", "en"))
+                load_json.assert_not_called()
+            self.assertIs(def_module.dictionary, manager.dictionary)
+            manager.close()
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,22 +3,86 @@
 import unittest
 from unittest.mock import patch
 from core.dictionary_manager import DictionaryManager
+from core import storage
 import os
 import json
 import csv
+import tempfile
+from types import MappingProxyType, SimpleNamespace
+
+# Corpo da resposta da API para 'apple', serializado uma única vez
+_APPLE_PAYLOAD = json.dumps([{
+    "word": "apple",
+    "meanings": [{
+        "partOfSpeech": "noun",
+        "definitions": [{
+            "definition": "A round fruit with red or green skin and a whitish interior.",
+            "example": "I ate a delicious apple for breakfast."
+        }]
+    }]
+}]).encode('utf-8')
+
+# Arquivos CSV de importação usados nos testes, montados uma única vez
+_IMPORT_CSV_BYTES = (
+    b"word,definition,part_of_speech,example\r\n"
+    b"banana,A long curved fruit with a yellow skin.,noun,I ate a ripe banana.\r\n"
+    b"cat,A small domesticated carnivorous mammal.,noun,The cat sat on the mat.\r\n"
+)
+_APPLE_APPEND_BYTES = b"apple,\"A common, round fruit produced by the tree Malus domestica.\",noun,He picked an apple from the tree.\r\n"
+_MISSING_FIELDS_CSV_BYTES = (
+    b"word,definition,part_of_speech,example\r\n"
+    # Palavra com definição faltando
+    b"tree,,noun,The tree is tall.\r\n"
+    # Palavra completa
+    b"flower,The seed-bearing part of a plant.,noun,The flower is blooming.\r\n"
+    # Palavra com exemplo faltando
+    b"river,A large natural stream of water.,noun,\r\n"
+)
+
+# Configuração de idiomas usada em todos os testes; cada teste recebe uma cópia
+_LANGUAGE_DATA = MappingProxyType({
+    "en": MappingProxyType({
+        "name": "English",
+        "code": "en-US",
+        "gtts_code": "en"
+    })
+})
+
+# Entradas já existentes no dicionário antes de alguns testes; copiadas ao serem inseridas
+_SEED_APPLE = MappingProxyType({"definition": "A fruit", "part_of_speech": "noun", "example": "An apple a day keeps the doctor away."})
+_SEED_BOOK = MappingProxyType({"definition": "A written work", "part_of_speech": "noun", "example": "She read a book."})
+
+# Entradas esperadas no dicionário após cada inserção
+_EXPECTED_APPLE = {
+    "definition": "A round fruit with red or green skin and a whitish interior.",
+    "part_of_speech": "noun",
+    "example": "I ate a delicious apple for breakfast."
+}
+_EXPECTED_BOOK = {
+    "definition": "A written or printed work consisting of pages glued or sewn together along one side and bound in covers.",
+    "part_of_speech": "noun",
+    "example": "She read a fascinating book about space exploration."
+}
+_EXPECTED_BANANA = {"definition": "A long curved fruit with a yellow skin.", "part_of_speech": "noun", "example": "I ate a ripe banana."}
+_EXPECTED_CAT = {"definition": "A small domesticated carnivorous mammal.", "part_of_speech": "noun", "example": "The cat sat on the mat."}
+_EXPECTED_DOG = {"definition": "A domesticated carnivorous mammal.", "part_of_speech": "noun", "example": "The dog barked loudly."}
+_EXPECTED_FLOWER = {"definition": "The seed-bearing part of a plant.", "part_of_speech": "noun", "example": "The flower is blooming."}
+
+def _response(status_code, content=b''):
+    """Cria uma resposta HTTP simulada leve, com apenas os atributos lidos pelo DictionaryManager."""
+    return SimpleNamespace(status_code=status_code, content=content)
 
 class TestDictionaryManager(unittest.TestCase):
     def setUp(self):
         """Configuração antes de cada teste."""
-        # Caminhos para os arquivos de teste
-        self.test_dict_path = os.path.join('data', 'test_dictionary_data.json')
-        self.test_lang_path = os.path.join('data', 'test_language_data.json')
-        self.test_export_path = os.path.join('data', 'test_export', 'test_dictionary_export.csv')
-        self.test_import_path = os.path.join('data', 'test_import', 'test_import.csv')
-        
-        # Criar os diretórios 'data/', 'data/test_export/', e 'data/test_import/' se não existirem
-        os.makedirs('data/test_export/', exist_ok=True)
-        os.makedirs('data/test_import/', exist_ok=True)
+        # Cada teste usa um diretório temporário próprio, fora da árvore do repositório
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dict_path = os.path.join(self._tmp.name, 'test_dictionary_data.json')
+        self.test_lang_path = os.path.join(self._tmp.name, 'test_language_data.json')
+        self.test_export_path = os.path.join(self._tmp.name, 'test_export', 'test_dictionary_export.csv')
+        self.test_import_path = os.path.join(self._tmp.name, 'test_import', 'test_import.csv')
+        os.makedirs(os.path.dirname(self.test_export_path))
+        os.makedirs(os.path.dirname(self.test_import_path))
         
         # Inicializa o DictionaryManager com caminhos de teste
         self.manager = DictionaryManager(
@@ -29,106 +93,56 @@ class TestDictionaryManager(unittest.TestCase):
         
         # Inicializa com dados vazios e configurações de idioma
         self.manager.dictionary = {}
-        self.manager.language_data = {
-            "en": {
-                "name": "English",
-                "code": "en-US",
-                "gtts_code": "en"
-            }
-        }
+        self.manager.language_data = {code: dict(data) for code, data in _LANGUAGE_DATA.items()}
         self.manager.save_data()
 
     def tearDown(self):
-        """Limpa os arquivos de teste após cada teste."""
-        # Remover arquivos de dicionário e idiomas de teste
-        if os.path.exists(self.test_dict_path):
-            os.remove(self.test_dict_path)
-        if os.path.exists(self.test_lang_path):
-            os.remove(self.test_lang_path)
-        
-        # Remover arquivos de exportação de teste
-        if os.path.exists(self.test_export_path):
-            os.remove(self.test_export_path)
-        export_dir = os.path.dirname(self.test_export_path)
-        if os.path.exists(export_dir) and not os.listdir(export_dir):
-            os.rmdir(export_dir)
-        
-        # Remover arquivos de importação de teste
-        if os.path.exists(self.test_import_path):
-            os.remove(self.test_import_path)
-        import_dir = os.path.dirname(self.test_import_path)
-        if os.path.exists(import_dir) and not os.listdir(import_dir):
-            os.rmdir(import_dir)
-        
-        # Remove backups criados durante os testes
-        for file in os.listdir('data'):
-            if file.startswith('test_dictionary_data.json.backup'):
-                os.remove(os.path.join('data', file))
-            if file.startswith('test_language_data.json.backup'):
-                os.remove(os.path.join('data', file))
-        
-        # Remover diretórios de exportação e importação se vazios
-        if os.path.exists('data/test_export/') and not os.listdir('data/test_export/'):
-            os.rmdir('data/test_export/')
-        if os.path.exists('data/test_import/') and not os.listdir('data/test_import/'):
-            os.rmdir('data/test_import/')
-
-    @patch('core.dictionary_manager.requests.get')
+        """Remove o diretório temporário do teste, com todos os arquivos gerados."""
+        self._tmp.cleanup()
+
+    def _load_dict_json(self):
+        """Lê o JSON do dicionário gravado em disco."""
+        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def _load_export_rows(self):
+        """Lê as linhas do CSV de exportação."""
+        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
+            return list(csv.DictReader(csvfile))
+
+    def _read_export_words(self):
+        """Lê apenas a coluna 'word' do CSV de exportação, por posição, sem criar um dict por linha."""
+        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            if 'word' not in header:
+                return []
+            word_index = header.index('word')
+            return [row[word_index] for row in reader]
+
+    @patch('core.dictionary_manager.requests.Session.get')
     def test_add_word_success_api(self, mock_get):
         """Testa a adição de uma palavra com sucesso via API."""
         # Define o comportamento do mock para a resposta da API
-        mock_response = unittest.mock.Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{
-            "word": "apple",
-            "meanings": [{
-                "partOfSpeech": "noun",
-                "definitions": [{
-                    "definition": "A round fruit with red or green skin and a whitish interior.",
-                    "example": "I ate a delicious apple for breakfast."
-                }]
-            }]
-        }]
-        mock_get.return_value = mock_response
+        mock_get.return_value = _response(200, _APPLE_PAYLOAD)
 
         success, message = self.manager.add_word("apple", "en")
         self.assertTrue(success)
         self.assertEqual(message, "Palavra adicionada com sucesso.")
         
-        # Verifica se a palavra foi adicionada ao dicionário
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertIn("apple", data["en"])
-            self.assertIn("definition", data["en"]["apple"])
-            self.assertIn("part_of_speech", data["en"]["apple"])
-            self.assertIn("example", data["en"]["apple"])
-            self.assertEqual(data["en"]["apple"]["definition"], "A round fruit with red or green skin and a whitish interior.")
-            self.assertEqual(data["en"]["apple"]["part_of_speech"], "noun")
-            self.assertEqual(data["en"]["apple"]["example"], "I ate a delicious apple for breakfast.")
+        # Verifica se a palavra foi adicionada ao dicionário (após incorporar o journal ao JSON)
+        self.manager.compact()
+        data = self._load_dict_json()
+        self.assertEqual(data["en"].get("apple"), _EXPECTED_APPLE)
         
         # Verifica se o arquivo de exportação foi atualizado corretamente
         self.assertTrue(os.path.exists(self.test_export_path))
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 1)
-            self.assertEqual(rows[0]['word'], "apple")
-            self.assertEqual(rows[0]['definition'], "A round fruit with red or green skin and a whitish interior.")
-            self.assertEqual(rows[0]['part_of_speech'], "noun")
-            self.assertEqual(rows[0]['example'], "I ate a delicious apple for breakfast.")
+        self.assertEqual(self._load_export_rows(), [{"word": "apple", **_EXPECTED_APPLE}])
 
     def test_add_word_existing(self):
         """Testa a adição de uma palavra que já existe."""
         # Adiciona uma palavra manualmente
-        self.manager.dictionary = {
-            "en": {
-                "apple": {
-                    "definition": "A fruit",
-                    "part_of_speech": "noun",
-                    "example": "An apple a day keeps the doctor away."
-                }
-            }
-        }
+        self.manager.dictionary = {"en": {"apple": dict(_SEED_APPLE)}}
         self.manager.save_data()
         
         # Tenta adicionar a mesma palavra novamente
@@ -138,32 +152,77 @@ class TestDictionaryManager(unittest.TestCase):
         
         # Verifica que o arquivo de exportação não foi alterado
         self.assertTrue(os.path.exists(self.test_export_path))
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            # Nenhuma palavra deveria estar exportada ainda, já que nenhuma operação de exportação foi realizada
-            self.assertEqual(len(rows), 0)
+        # Nenhuma palavra deveria estar exportada ainda, já que nenhuma operação de exportação foi realizada
+        self.assertEqual(len(self._read_export_words()), 0)
 
-    @patch('core.dictionary_manager.requests.get')
+    @patch('core.dictionary_manager.requests.Session.get')
     def test_add_word_api_failure(self, mock_get):
         """Testa a adição de uma palavra quando a API não retorna dados."""
         # Define o comportamento do mock para a resposta da API
-        mock_response = unittest.mock.Mock()
-        mock_response.status_code = 404  # Simula uma resposta não encontrada
-        mock_get.return_value = mock_response
+        mock_get.return_value = _response(404)  # Simula uma resposta não encontrada
 
         success, message = self.manager.add_word("qwerty", "en")
         self.assertFalse(success)
         self.assertEqual(message, "Definição e exemplo não encontrados na API. Por favor, forneça manualmente.")
         
         # Verifica que a palavra não foi adicionada ao dicionário
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertNotIn("qwerty", data.get("en", {}))
+        data = self._load_dict_json()
+        self.assertNotIn("qwerty", data.get("en", {}))
         
         # Verifica que o arquivo de exportação não foi alterado
         self.assertFalse(os.path.exists(self.test_export_path))
 
+    @patch('core.dictionary_manager.requests.Session.get')
+    def test_fetch_definition_cached(self, mock_get):
+        """Testa se respostas da API são reaproveitadas e falhas não ficam em cache."""
+        mock_get.return_value = _response(404)
+        self.assertIsNone(self.manager.fetch_definition_from_api("apple", "en"))
+
+        mock_get.return_value = _response(200, json.dumps([{
+            "meanings": [{"partOfSpeech": "noun", "definitions": [{"definition": "A fruit.", "example": "An apple."}]}]
+        }]).encode('utf-8'))
+        first = self.manager.fetch_definition_from_api("apple", "en")
+        second = self.manager.fetch_definition_from_api("apple", "en")
+        self.assertEqual(first, second)
+        self.assertEqual(first["definition"], "A fruit.")
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_get_definition_cache(self):
+        """Testa se o cache de get_definition usa a palavra normalizada e só descarta as palavras alteradas."""
+        self.manager.manual_add_word("apple", "en", "A fruit", "noun", "An apple a day.")
+        self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+        apple = self.manager.get_definition("Apple", "en")
+        self.assertIs(self.manager.get_definition(" apple ", "en"), apple)
+        book = self.manager.get_definition("book", "en")
+        with self.assertRaises(TypeError):
+            apple["definition"] = "Changed."
+
+        self.manager.remove_word("apple", "en")
+        self.assertIsNone(self.manager.get_definition("apple", "en"))
+        self.assertIs(self.manager.get_definition("book", "en"), book)
+
+        with patch.object(DictionaryManager, 'DEFINITION_CACHE_SIZE', 2):
+            self.manager.get_definition("cat", "en")
+        self.assertNotIn(("en", "book"), self.manager._defn_cache)
+        self.assertIn(("en", "cat"), self.manager._defn_cache)
+
+    @patch('core.dictionary_manager.requests.Session.get')
+    def test_fetch_definitions_bulk(self, mock_get):
+        """Testa a busca de várias palavras em paralelo, com uma requisição por palavra distinta."""
+        def fake_get(url, timeout):
+            word = url.rsplit('/', 1)[-1]
+            if word == "qwerty":
+                return _response(404)
+            body = [{"meanings": [{"partOfSpeech": "noun", "definitions": [{"definition": f"Def {word}."}]}]}]
+            return _response(200, json.dumps(body).encode('utf-8'))
+        mock_get.side_effect = fake_get
+
+        results = self.manager.fetch_definitions_bulk(["apple", "book", "qwerty", "apple"], "en")
+        self.assertEqual(list(results), ["apple", "book", "qwerty"])
+        self.assertEqual(results["book"]["definition"], "Def book.")
+        self.assertIsNone(results["qwerty"])
+        self.assertEqual(mock_get.call_count, 3)
+
     def test_add_word_manual(self):
         """Testa a adição manual de uma palavra sem usar a API."""
         success, message = self.manager.manual_add_word(
@@ -176,87 +235,234 @@ class TestDictionaryManager(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(message, "Palavra adicionada com sucesso.")
         
-        # Verifica se a palavra foi adicionada ao dicionário
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertIn("book", data["en"])
-            self.assertEqual(data["en"]["book"]["definition"], "A written or printed work consisting of pages glued or sewn together along one side and bound in covers.")
-            self.assertEqual(data["en"]["book"]["part_of_speech"], "noun")
-            self.assertEqual(data["en"]["book"]["example"], "She read a fascinating book about space exploration.")
+        # Verifica se a palavra foi adicionada ao dicionário (após incorporar o journal ao JSON)
+        self.manager.compact()
+        data = self._load_dict_json()
+        self.assertEqual(data["en"].get("book"), _EXPECTED_BOOK)
         
         # Verifica se o arquivo de exportação foi atualizado corretamente
         self.assertTrue(os.path.exists(self.test_export_path))
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 1)
-            self.assertEqual(rows[0]['word'], "book")
-            self.assertEqual(rows[0]['definition'], "A written or printed work consisting of pages glued or sewn together along one side and bound in covers.")
-            self.assertEqual(rows[0]['part_of_speech'], "noun")
-            self.assertEqual(rows[0]['example'], "She read a fascinating book about space exploration.")
+        self.assertEqual(self._load_export_rows(), [{"word": "book", **_EXPECTED_BOOK}])
+
+    def test_add_word_manual_invalid_word(self):
+        """Testa se palavras com dígitos ou símbolos são rejeitadas na adição manual."""
+        for word in ["b00k", "@home", "-dash"]:
+            with self.subTest(word=word):
+                success, _ = self.manager.manual_add_word(word, "en", "A definition", "noun", "An example.")
+                self.assertFalse(success)
+        self.assertNotIn("b00k", self.manager.dictionary.get("en", {}))
 
     def test_remove_word(self):
         """Testa a remoção de uma palavra e atualização do arquivo de exportação."""
         # Adiciona uma palavra manualmente
-        self.manager.dictionary = {
-            "en": {
-                "apple": {
-                    "definition": "A fruit",
-                    "part_of_speech": "noun",
-                    "example": "An apple a day keeps the doctor away."
-                },
-                "book": {
-                    "definition": "A written work",
-                    "part_of_speech": "noun",
-                    "example": "She read a book."
-                }
-            }
-        }
+        self.manager.dictionary = {"en": {"apple": dict(_SEED_APPLE), "book": dict(_SEED_BOOK)}}
         self.manager.save_data()
         
         # Exporta o dicionário
         self.manager.export_dictionary_to_csv("en", self.test_export_path)
         self.assertTrue(os.path.exists(self.test_export_path))
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 2)
+        rows = self._load_export_rows()
+        self.assertEqual(len(rows), 2)
         
         # Remove uma palavra
         success, message = self.manager.remove_word("apple", "en")
         self.assertTrue(success)
         self.assertEqual(message, "Palavra removida com sucesso.")
         
-        # Verifica que a palavra foi removida do dicionário
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertNotIn("apple", data["en"])
-            self.assertIn("book", data["en"])
+        # Verifica que a palavra foi removida do dicionário (após incorporar o journal ao JSON)
+        self.manager.compact()
+        data = self._load_dict_json()
+        self.assertNotIn("apple", data["en"])
+        self.assertIn("book", data["en"])
         
         # Verifica que o arquivo de exportação foi atualizado
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 1)
-            self.assertEqual(rows[0]['word'], "book")
+        self.manager.flush_csv()
+        rows = self._load_export_rows()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['word'], "book")
+
+    def test_batch_saves_once(self):
+        """Testa se, em lote, as alterações só são gravadas no JSON e no CSV ao fim do bloco."""
+        with self.manager:
+            self.manager.manual_add_word("apple", "en", "A fruit", "noun", "An apple a day.")
+            self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+            self.assertFalse(os.path.exists(self.test_dict_path + '.wal'))
+            self.assertNotIn("apple", self._load_dict_json().get("en", {}))
+
+        self.assertFalse(os.path.exists(self.test_dict_path + '.wal'))
+        self.assertEqual(sorted(self._load_dict_json()["en"]), ["apple", "book"])
+        self.assertEqual(self._read_export_words(), ["apple", "book"])
+
+    def test_snapshot_used_on_load(self):
+        """Testa se um novo DictionaryManager carrega o dicionário do snapshot gravado junto com o JSON."""
+        self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+        self.manager.compact()
+        self.assertTrue(os.path.exists(self.test_dict_path + '.pkl'))
+
+        with patch('core.dictionary_manager.storage.load_json', wraps=storage.load_json) as load_json:
+            reloaded = DictionaryManager(
+                dictionary_path=self.test_dict_path,
+                language_data_path=self.test_lang_path,
+                export_csv_path=self.test_export_path
+            )
+        self.assertNotIn(self.test_dict_path, [call.args[0] for call in load_json.call_args_list])
+        self.assertEqual(reloaded.get_definition("book", "en")["definition"], "A written work")
+        reloaded.close()
+
+    def test_journal_replayed_on_load(self):
+        """Testa se alterações registradas no journal são aplicadas ao carregar um novo DictionaryManager."""
+        self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+        self.assertTrue(os.path.exists(self.test_dict_path + '.wal'))
+        self.assertNotIn("book", self._load_dict_json().get("en", {}))
+
+        reloaded = DictionaryManager(
+            dictionary_path=self.test_dict_path,
+            language_data_path=self.test_lang_path,
+            export_csv_path=self.test_export_path
+        )
+        self.assertEqual(reloaded.get_definition("book", "en")["definition"], "A written work")
+
+        reloaded.close()
+        self.assertFalse(os.path.exists(self.test_dict_path + '.wal'))
+
+    def test_export_updated_incrementally(self):
+        """Testa se adições são acrescentadas ao CSV e remoções só são refletidas em flush_csv()."""
+        self.manager.manual_add_word("apple", "en", "A fruit", "noun", "An apple a day.")
+        self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+        self.assertEqual(self._read_export_words(), ["apple", "book"])
+
+        self.manager.remove_word("apple", "en")
+        self.assertEqual(len(self._read_export_words()), 2)
+
+        self.assertTrue(self.manager.flush_csv())
+        self.assertEqual(self._read_export_words(), ["book"])
+
+    def test_export_readd_after_remove_not_duplicated(self):
+        """Testa se readicionar uma palavra com remoção pendente no CSV não duplica a linha dela."""
+        self.manager.manual_add_word("apple", "en", "A fruit", "noun", "An apple a day.")
+        self.manager.remove_word("apple", "en")
+        self.manager.manual_add_word("apple", "en", "A red fruit", "noun", "An apple a day.")
+        self.assertEqual(self._read_export_words(), ["apple"])
+        self.assertEqual(self._load_export_rows()[0]['definition'], "A red fruit")
+
+    def test_batch_exports_every_language(self):
+        """Testa se um bloco em lote que altera vários idiomas exporta cada um deles ao fim do bloco."""
+        with patch.object(self.manager, 'export_dictionary_to_csv', wraps=self.manager.export_dictionary_to_csv) as export:
+            with self.manager:
+                self.manager.manual_add_word("apple", "en", "A fruit", "noun", "An apple a day.")
+                self.manager.manual_add_word("livro", "pt", "Obra escrita", "substantivo", "Ela leu um livro.")
+                self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+        self.assertEqual([call.args[0] for call in export.call_args_list], ["pt", "en"])
+        self.assertEqual(self._read_export_words(), ["apple", "book"])
+
+    def test_list_words_kept_sorted(self):
+        """Testa se a listagem continua ordenada após adições e remoções."""
+        self.manager.manual_add_word("cat", "en", "A small mammal", "noun", "The cat sat.")
+        self.manager.manual_add_word("apple", "en", "A fruit", "noun", "An apple a day.")
+        self.assertEqual(self.manager.list_words("en"), ["apple", "cat"])
+
+        self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+        self.manager.remove_word("cat", "en")
+        self.assertEqual(self.manager.list_words("en"), ["apple", "book"])
+
+    def test_available_languages(self):
+        """Testa se os idiomas disponíveis vêm de language_data e acompanham a troca desses dados."""
+        self.assertEqual(self.manager.available_languages(), tuple(self.manager.language_data))
+        self.manager.language_data = {"en": {}, "de": {}}
+        self.assertEqual(self.manager.available_languages(), ("en", "de"))
+
+    def test_import_rows(self):
+        """Testa se os registros são consumidos em fluxo, ignorando incompletos e duplicatas."""
+        rows = iter([
+            ("Apple", "A fruit", "noun", "An apple a day."),
+            ("book", "", "noun", ""),
+            ("apple", "Another fruit", "noun", ""),
+        ])
+        with patch.object(self.manager, 'save_data') as save_data:
+            self.assertEqual(self.manager.import_rows(rows, "en"), (1, 2))
+        save_data.assert_called_once()
+        self.assertEqual(self.manager.get_definition("apple", "en")["definition"], "A fruit")
+
+    def test_import_rows_failure_leaves_dictionary_unchanged(self):
+        """Testa se uma falha no meio da leitura não deixa palavras parcialmente importadas nem caches desatualizados."""
+        self.assertIsNone(self.manager.get_definition("apple", "en"))
+        revision = self.manager.revision
+
+        def rows():
+            yield ("apple", "A fruit", "noun", "")
+            raise UnicodeDecodeError('utf-8', b'\xe9', 0, 1, 'invalid continuation byte')
+
+        with self.assertRaises(UnicodeDecodeError):
+            self.manager.import_rows(rows(), "en")
+        self.assertIsNone(self.manager.get_definition("apple", "en"))
+        self.assertNotIn("en", self.manager.dictionary)
+        self.assertEqual(self.manager.revision, revision)
+
+    def test_import_arrow_batches(self):
+        """Testa se lotes em colunas do PyArrow são importados tratando valores nulos como vazios."""
+        batches = [
+            {"word": ["Apple"], "definition": ["A fruit"], "part_of_speech": ["noun"], "example": [None]},
+            {"word": ["book"], "definition": ["A work"], "part_of_speech": [None], "example": ["A good book."]},
+        ]
+        with patch.object(self.manager, 'save_data'):
+            self.assertEqual(self.manager.import_arrow_batches(batches, "en"), (1, 1))
+        self.assertEqual(self.manager.get_definition("apple", "en")["example"], "")
+
+    def test_import_arrow_batches_failure_saves_nothing(self):
+        """Testa se uma falha em um lote intermediário não deixa os lotes anteriores gravados."""
+        def batches():
+            yield {"word": ["apple"], "definition": ["A fruit"], "part_of_speech": ["noun"]}
+            raise ValueError("lote inválido")
+
+        with patch.object(self.manager, 'save_data') as save_data:
+            with self.assertRaises(ValueError):
+                self.manager.import_arrow_batches(batches(), "en")
+        save_data.assert_not_called()
+        self.assertIsNone(self.manager.get_definition("apple", "en"))
+
+    def test_torn_journal_keeps_dictionary(self):
+        """Testa se uma escrita interrompida no journal não faz perder as palavras já gravadas."""
+        self.manager.manual_add_word("apple", "en", "A fruit", "noun", "An apple a day.")
+        self.manager.manual_add_word("book", "en", "A written work", "noun", "She read a book.")
+        with open(self.test_dict_path + storage.JOURNAL_SUFFIX, 'ab') as file:
+            file.write(b'{"op": "add", "lang": "en", "wo')
+
+        # Reinicia sem encerrar: a palavra nova fica apenas no journal
+        manager = DictionaryManager(self.test_dict_path, self.test_lang_path, self.test_export_path)
+        manager.manual_add_word("dog", "en", "An animal", "noun", "The dog barked.")
+
+        reloaded = DictionaryManager(self.test_dict_path, self.test_lang_path, self.test_export_path)
+        self.assertEqual(reloaded.list_words("en"), ["apple", "book", "dog"])
+        reloaded.close()
+        self.assertEqual(sorted(self._load_dict_json()["en"]), ["apple", "book", "dog"])
+
+    def test_failed_load_does_not_save(self):
+        """Testa se, após uma falha de carregamento, o JSON ilegível não é sobrescrito pelo dicionário vazio."""
+        with open(self.test_dict_path, 'wb') as file:
+            file.write(b'{"en": {"apple": ')
+        manager = DictionaryManager(self.test_dict_path, self.test_lang_path, self.test_export_path)
+        self.assertEqual(manager.dictionary, {})
+        self.assertFalse(manager.save_data())
+        manager.close()
+        with open(self.test_dict_path, 'rb') as file:
+            self.assertEqual(file.read(), b'{"en": {"apple": ')
+
+    def test_prefix_search(self):
+        """Testa se as sugestões por prefixo vêm em ordem alfabética, respeitam o limite e acompanham as alterações."""
+        for word in ["apply", "apple", "application", "book"]:
+            self.manager.manual_add_word(word, "en", "Some meaning", "noun", "An example.")
+        self.assertEqual(self.manager.prefix_search("App", "en"), ["apple", "application", "apply"])
+        self.assertEqual(self.manager.prefix_search("app", "en", 2), ["apple", "application"])
+        self.assertEqual(self.manager.prefix_search("x", "en"), [])
+        self.assertEqual(self.manager.prefix_search("app", "xx"), [])
+
+        self.manager.remove_word("apple", "en")
+        self.assertEqual(self.manager.prefix_search("app", "en"), ["application", "apply"])
 
     def test_export_dictionary_to_csv(self):
         """Testa a exportação do dicionário para um arquivo CSV."""
         # Adiciona duas palavras manualmente
-        self.manager.dictionary = {
-            "en": {
-                "apple": {
-                    "definition": "A fruit",
-                    "part_of_speech": "noun",
-                    "example": "An apple a day keeps the doctor away."
-                },
-                "book": {
-                    "definition": "A written work",
-                    "part_of_speech": "noun",
-                    "example": "She read a book."
-                }
-            }
-        }
+        self.manager.dictionary = {"en": {"apple": dict(_SEED_APPLE), "book": dict(_SEED_BOOK)}}
         self.manager.save_data()
         
         # Exporta o dicionário
@@ -265,59 +471,21 @@ class TestDictionaryManager(unittest.TestCase):
         self.assertTrue(os.path.exists(self.test_export_path))
         
         # Verifica o conteúdo do CSV
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 2)
-            expected_words = {"apple", "book"}
-            exported_words = {row['word'] for row in rows}
-            self.assertEqual(exported_words, expected_words)
-            for row in rows:
-                if row['word'] == "apple":
-                    self.assertEqual(row['definition'], "A fruit")
-                    self.assertEqual(row['part_of_speech'], "noun")
-                    self.assertEqual(row['example'], "An apple a day keeps the doctor away.")
-                elif row['word'] == "book":
-                    self.assertEqual(row['definition'], "A written work")
-                    self.assertEqual(row['part_of_speech'], "noun")
-                    self.assertEqual(row['example'], "She read a book.")
-
-    @patch('core.dictionary_manager.requests.get')
-    def test_import_dictionary_from_csv(self, mock_get):
+        rows = self._load_export_rows()
+        self.assertEqual(len(rows), 2)
+        self.assertDictEqual({row['word']: row for row in rows}, {
+            "apple": {"word": "apple", **_SEED_APPLE},
+            "book": {"word": "book", **_SEED_BOOK}
+        })
+
+    def test_import_dictionary_from_csv(self):
         """Testa a importação de palavras a partir de um arquivo CSV e atualização do export CSV."""
         # Cria um arquivo CSV de importação com duas novas palavras
-        import_dir = os.path.dirname(self.test_import_path)
-        os.makedirs(import_dir, exist_ok=True)
-        with open(self.test_import_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['word', 'definition', 'part_of_speech', 'example']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerow({
-                'word': 'banana',
-                'definition': 'A long curved fruit with a yellow skin.',
-                'part_of_speech': 'noun',
-                'example': 'I ate a ripe banana.'
-            })
-            writer.writerow({
-                'word': 'cat',
-                'definition': 'A small domesticated carnivorous mammal.',
-                'part_of_speech': 'noun',
-                'example': 'The cat sat on the mat.'
-            })
-        
-        # Mock a resposta da API para garantir que nenhuma palavra será duplicada
-        mock_get.return_value = unittest.mock.Mock(status_code=404)
+        with open(self.test_import_path, 'wb') as csvfile:
+            csvfile.write(_IMPORT_CSV_BYTES)
         
         # Adiciona uma palavra existente para testar duplicatas
-        self.manager.dictionary = {
-            "en": {
-                "apple": {
-                    "definition": "A fruit",
-                    "part_of_speech": "noun",
-                    "example": "An apple a day keeps the doctor away."
-                }
-            }
-        }
+        self.manager.dictionary = {"en": {"apple": dict(_SEED_APPLE)}}
         self.manager.save_data()
         
         # Exporta o dicionário antes da importação
@@ -329,37 +497,20 @@ class TestDictionaryManager(unittest.TestCase):
         self.assertEqual(message, "Dicionário importado com sucesso. 2 palavras adicionadas, 0 palavras ignoradas.")
         
         # Verifica se as novas palavras foram adicionadas
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertIn("banana", data["en"])
-            self.assertIn("cat", data["en"])
-            self.assertIn("apple", data["en"])  # Palavra existente deve permanecer
-            self.assertEqual(data["en"]["banana"]["definition"], "A long curved fruit with a yellow skin.")
-            self.assertEqual(data["en"]["banana"]["part_of_speech"], "noun")
-            self.assertEqual(data["en"]["banana"]["example"], "I ate a ripe banana.")
-            self.assertEqual(data["en"]["cat"]["definition"], "A small domesticated carnivorous mammal.")
-            self.assertEqual(data["en"]["cat"]["part_of_speech"], "noun")
-            self.assertEqual(data["en"]["cat"]["example"], "The cat sat on the mat.")
+        data = self._load_dict_json()
+        self.assertIn("apple", data["en"])  # Palavra existente deve permanecer
+        self.assertEqual(data["en"].get("banana"), _EXPECTED_BANANA)
+        self.assertEqual(data["en"].get("cat"), _EXPECTED_CAT)
         
         # Verifica se o arquivo de exportação foi atualizado corretamente
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 3)  # apple, banana, cat
-            exported_words = {row['word'] for row in rows}
-            expected_words = {"apple", "banana", "cat"}
-            self.assertEqual(exported_words, expected_words)
+        exported_words = self._read_export_words()
+        self.assertEqual(len(exported_words), 3)  # apple, banana, cat
+        self.assertSetEqual(set(exported_words), {"apple", "banana", "cat"})
         
         # Testa a importação com palavras já existentes
         # Adiciona 'apple' novamente no CSV
-        with open(self.test_import_path, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=['word', 'definition', 'part_of_speech', 'example'])
-            writer.writerow({
-                'word': 'apple',
-                'definition': 'A common, round fruit produced by the tree Malus domestica.',
-                'part_of_speech': 'noun',
-                'example': 'He picked an apple from the tree.'
-            })
+        with open(self.test_import_path, 'ab') as csvfile:
+            csvfile.write(_APPLE_APPEND_BYTES)
         
         # Importa novamente
         success, message = self.manager.import_dictionary_from_csv(self.test_import_path, "en")
@@ -367,20 +518,13 @@ class TestDictionaryManager(unittest.TestCase):
         self.assertEqual(message, "Dicionário importado com sucesso. 2 palavras adicionadas, 1 palavras ignoradas.")
         
         # Verifica que 'apple' não foi duplicada ou alterada
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertIn("apple", data["en"])
-            self.assertEqual(data["en"]["apple"]["definition"], "A fruit")
-            self.assertEqual(data["en"]["apple"]["part_of_speech"], "noun")
-            self.assertEqual(data["en"]["apple"]["example"], "An apple a day keeps the doctor away.")
+        data = self._load_dict_json()
+        self.assertEqual(data["en"].get("apple"), _SEED_APPLE)
         
         # Verifica que o arquivo de exportação não contém duplicatas
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 3)  # apple, banana, cat (apple não duplicado)
-            exported_words = {row['word'] for row in rows}
-            self.assertEqual(exported_words, {"apple", "banana", "cat"})
+        exported_words = self._read_export_words()
+        self.assertEqual(len(exported_words), 3)  # apple, banana, cat (apple não duplicado)
+        self.assertSetEqual(set(exported_words), {"apple", "banana", "cat"})
 
     def test_export_dictionary_without_words(self):
         """Testa a exportação do dicionário quando não há palavras."""
@@ -401,16 +545,13 @@ class TestDictionaryManager(unittest.TestCase):
         success = self.manager.export_dictionary_to_csv("en", self.test_export_path)
         self.assertTrue(success)
         self.assertTrue(os.path.exists(self.test_export_path))
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 0)  # Nenhuma palavra para exportar
+        self.assertEqual(len(self._read_export_words()), 0)  # Nenhuma palavra para exportar
 
     def test_validate_json(self):
         """Testa a validação de arquivos JSON."""
         # Cria um JSON válido
-        with open(self.test_dict_path, 'w', encoding='utf-8') as file:
-            json.dump({"en": {"apple": {"definition": "A fruit", "part_of_speech": "noun", "example": "An apple a day."}}}, file)
+        with open(self.test_dict_path, 'wb') as file:
+            file.write(storage.dumps({"en": {"apple": {"definition": "A fruit", "part_of_speech": "noun", "example": "An apple a day."}}}))
         
         is_valid = self.manager.validate_json(self.test_dict_path)
         self.assertTrue(is_valid)
@@ -439,45 +580,13 @@ class TestDictionaryManager(unittest.TestCase):
         self.assertTrue(os.path.exists(self.test_export_path))
         
         # Verifica o conteúdo do CSV
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 1)
-            self.assertEqual(rows[0]['word'], "dog")
-            self.assertEqual(rows[0]['definition'], "A domesticated carnivorous mammal.")
-            self.assertEqual(rows[0]['part_of_speech'], "noun")
-            self.assertEqual(rows[0]['example'], "The dog barked loudly.")
+        self.assertEqual(self._load_export_rows(), [{"word": "dog", **_EXPECTED_DOG}])
 
     def test_import_dictionary_with_missing_fields(self):
         """Testa a importação de um CSV com campos ausentes ou vazios."""
         # Cria um arquivo CSV de importação com campos ausentes
-        import_dir = os.path.dirname(self.test_import_path)
-        os.makedirs(import_dir, exist_ok=True)
-        with open(self.test_import_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['word', 'definition', 'part_of_speech', 'example']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            # Palavra com definição faltando
-            writer.writerow({
-                'word': 'tree',
-                'definition': '',
-                'part_of_speech': 'noun',
-                'example': 'The tree is tall.'
-            })
-            # Palavra completa
-            writer.writerow({
-                'word': 'flower',
-                'definition': 'The seed-bearing part of a plant.',
-                'part_of_speech': 'noun',
-                'example': 'The flower is blooming.'
-            })
-            # Palavra com exemplo faltando
-            writer.writerow({
-                'word': 'river',
-                'definition': 'A large natural stream of water.',
-                'part_of_speech': 'noun',
-                'example': ''
-            })
+        with open(self.test_import_path, 'wb') as csvfile:
+            csvfile.write(_MISSING_FIELDS_CSV_BYTES)
         
         # Importa o dicionário a partir do CSV
         success, message = self.manager.import_dictionary_from_csv(self.test_import_path, "en")
@@ -485,22 +594,14 @@ class TestDictionaryManager(unittest.TestCase):
         self.assertEqual(message, "Dicionário importado com sucesso. 1 palavras adicionadas, 2 palavras ignoradas.")
         
         # Verifica que apenas 'flower' foi adicionada
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertIn("flower", data["en"])
-            self.assertNotIn("tree", data["en"])
-            self.assertNotIn("river", data["en"])
+        data = self._load_dict_json()
+        self.assertIn("flower", data["en"])
+        self.assertNotIn("tree", data["en"])
+        self.assertNotIn("river", data["en"])
         
         # Verifica que o arquivo de exportação foi atualizado corretamente
         self.assertTrue(os.path.exists(self.test_export_path))
-        with open(self.test_export_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = list(reader)
-            self.assertEqual(len(rows), 1)
-            self.assertEqual(rows[0]['word'], "flower")
-            self.assertEqual(rows[0]['definition'], "The seed-bearing part of a plant.")
-            self.assertEqual(rows[0]['part_of_speech'], "noun")
-            self.assertEqual(rows[0]['example'], "The flower is blooming.")
+        self.assertEqual(self._load_export_rows(), [{"word": "flower", **_EXPECTED_FLOWER}])
 
     def test_import_dictionary_invalid_csv(self):
         """Testa a importação de um arquivo CSV inválido."""
@@ -514,9 +615,8 @@ class TestDictionaryManager(unittest.TestCase):
         self.assertIn("Erro ao importar dicionário", message)
         
         # Verifica que nenhuma palavra foi adicionada
-        with open(self.test_dict_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            self.assertEqual(data["en"], {})
+        data = self._load_dict_json()
+        self.assertEqual(data["en"], {})
         
         # Verifica que o arquivo de exportação não foi criado
         self.assertFalse(os.path.exists(self.test_export_path))
@@ -0,0 +1,94 @@
+# tests/test_storage.py
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from core import storage
+
+class TestStorage(unittest.TestCase):
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'data.json')
+
+    def tearDown(self):
+        """Remove os arquivos temporários após cada teste."""
+        self.tmpdir.cleanup()
+
+    def test_dump_and_load_json(self):
+        """Testa se um objeto gravado com dump_json é lido de volta sem alterações."""
+        data = {"en": {"apple": {"definition": "A fruit", "part_of_speech": "noun", "example": "Maçã."}}}
+        storage.dump_json(data, self.path)
+        self.assertEqual(storage.load_json(self.path), data)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+    def test_dumps_layout_matches_stdlib(self):
+        """Testa se dumps produz o mesmo layout (indentação de 4 espaços) com e sem orjson."""
+        data = {"en": {"apple": {"definition": "A fruit", "example": "Maçã."}, "empty": {}}, "list": [1, []]}
+        expected = json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8')
+        self.assertEqual(storage.dumps(data), expected)
+        with patch.object(storage, 'orjson', None):
+            self.assertEqual(storage.dumps(data), expected)
+
+    def test_backup_survives_rewrite(self):
+        """Testa se o backup mantém o conteúdo anterior depois que o arquivo é regravado."""
+        storage.dump_json({"version": 1}, self.path)
+        backup_path = self.path + '.backup'
+        storage.backup_file(self.path, backup_path)
+        storage.dump_json({"version": 2}, self.path)
+        self.assertEqual(storage.load_json(backup_path), {"version": 1})
+        self.assertEqual(storage.load_json(self.path), {"version": 2})
+
+    def test_prune_backups(self):
+        """Testa se apenas os backups mais recentes criados pelo aplicativo são mantidos."""
+        for suffix in ['20240922215410', '1727000000000000000', '1727000000000000001', '1727000000000000002', 'manual']:
+            open(f"{self.path}.backup.{suffix}", 'w').close()
+        removed = storage.prune_backups(self.path, 2)
+        self.assertEqual(removed, [f"{self.path}.backup.1727000000000000000"])
+        self.assertTrue(os.path.exists(f"{self.path}.backup.20240922215410"))
+        self.assertTrue(os.path.exists(f"{self.path}.backup.manual"))
+
+    def test_stale_snapshot_not_deserialized(self):
+        """Testa se um snapshot desatualizado em relação ao JSON é descartado sem ser desserializado."""
+        storage.dump_json({"version": 1}, self.path)
+        storage.write_snapshot({"version": 1}, self.path)
+        self.assertEqual(storage.load_snapshot(self.path), {"version": 1})
+
+        storage.dump_json({"version": 22}, self.path)
+        with patch('core.storage.pickle.loads') as loads:
+            self.assertIsNone(storage.load_snapshot(self.path))
+            loads.assert_not_called()
+
+    def test_journal_replay(self):
+        """Testa se as operações do journal são aplicadas em ordem e o journal é descartado."""
+        storage.append_journal({'op': 'add', 'lang': 'en', 'word': 'apple', 'entry': {'definition': 'A fruit'}}, self.path)
+        storage.append_journal({'op': 'add', 'lang': 'en', 'word': 'book', 'entry': {'definition': 'A work'}}, self.path)
+        storage.append_journal({'op': 'remove', 'lang': 'en', 'word': 'apple'}, self.path)
+
+        dictionary = {}
+        self.assertEqual(storage.replay_journal(dictionary, self.path), 3)
+        self.assertEqual(dictionary, {'en': {'book': {'definition': 'A work'}}})
+
+        storage.truncate_journal(self.path)
+        self.assertEqual(storage.replay_journal({}, self.path), 0)
+
+    def test_journal_torn_tail(self):
+        """Testa se uma linha incompleta é descartada antes de novas operações e linhas ilegíveis são ignoradas."""
+        storage.append_journal({'op': 'add', 'lang': 'en', 'word': 'apple', 'entry': {'definition': 'A fruit'}}, self.path)
+        with open(self.path + storage.JOURNAL_SUFFIX, 'ab') as file:
+            file.write(b'{"op": "add", "lang": "en", "wo')
+
+        dictionary = {}
+        self.assertEqual(storage.replay_journal(dictionary, self.path), 1)
+        storage.append_journal({'op': 'add', 'lang': 'en', 'word': 'dog', 'entry': {'definition': 'An animal'}}, self.path)
+        with open(self.path + storage.JOURNAL_SUFFIX, 'ab') as file:
+            file.write(b'not json\n')
+
+        dictionary = {}
+        self.assertEqual(storage.replay_journal(dictionary, self.path), 2)
+        self.assertEqual(sorted(dictionary['en']), ['apple', 'dog'])
+
+if __name__ == '__main__':
+    unittest.main()